@@ -174,30 +174,32 @@ class AutonomousJobOperator:
 
     async def _extract_job_from_card(self, page, card, index: int) -> Dict[str, Any]:
         """Extract job details from a job card"""
-        try:
-            # Extract title
-            title_elem = await card.query_selector('a[data-testid="job-title"], h3 a, a.job-title')
-            title = await title_elem.inner_text() if title_elem else "Unknown Title"
-
-            # Extract company
-            company_elem = await card.query_selector('[data-testid="job-company"], .company-name, span.company')
-            company = await company_elem.inner_text() if company_elem else "Unknown Company"
+        async def text(elem, default: str) -> str:
+            return await elem.inner_text() if elem else default
 
-            # Extract location
-            location_elem = await card.query_selector('[data-testid="job-location"], .location, span.location')
-            location = await location_elem.inner_text() if location_elem else "Unknown Location"
+        async def href(elem):
+            return await elem.get_attribute('href') if elem else None
 
-            # Get job URL
-            link_elem = await card.query_selector('a')
-            job_url = await link_elem.get_attribute('href') if link_elem else None
+        try:
+            # The lookups and reads are independent - send each batch at once
+            title_elem, company_elem, location_elem, link_elem, desc_elem = await asyncio.gather(
+                card.query_selector('a[data-testid="job-title"], h3 a, a.job-title'),
+                card.query_selector('[data-testid="job-company"], .company-name, span.company'),
+                card.query_selector('[data-testid="job-location"], .location, span.location'),
+                card.query_selector('a'),
+                card.query_selector('[data-testid="job-snippet"], .job-snippet, p')
+            )
+            title, company, location, job_url, description = await asyncio.gather(
+                text(title_elem, "Unknown Title"),
+                text(company_elem, "Unknown Company"),
+                text(location_elem, "Unknown Location"),
+                href(link_elem),
+                text(desc_elem, "")
+            )
 
             if job_url and not job_url.startswith('http'):
                 job_url = f"https://www.seek.com.au{job_url}"
 
-            # Extract description preview
-            desc_elem = await card.query_selector('[data-testid="job-snippet"], .job-snippet, p')
-            description = await desc_elem.inner_text() if desc_elem else ""
-
             job_data = {
                 "index": index,
                 "title": title.strip(),
@@ -10,23 +10,56 @@ This operator:
 - Adapts to unexpected situations
 - Learns what works
 """
+from __future__ import annotations
+
 import asyncio
+import mmap
+import os
+import re
+import shelve
 import sys
+import time
+from array import array
 from pathlib import Path
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
+from urllib.parse import urlparse
 
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
-from playwright.async_api import async_playwright, Page
-import json
+from operator_shutdown import wait_for_shutdown
+
+if TYPE_CHECKING:
+    from playwright.async_api import Locator, Page
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, default=_json_default, indent=2).encode()
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+_EMAIL_RE = re.compile(rb'[\w\.-]+@[\w\.-]+\.\w+')
+_PHONE_RE = re.compile(rb'\(\d{3}\)\s*\d{3}-\d{4}')
+
+# Log decorations, built once
+_BAR = '═' * 80
+_RULE = '=' * 80
+_TOP = '╔' + '═' * 78 + '╗'
+_BOT = '╚' + '═' * 78 + '╝'
+_CYCLE_LINE = '║  CYCLE #%2d/%-2d' + ' ' * 64 + '║'
+_GOAL_LINE = '║  🎉 GOAL ACHIEVED!' + ' ' * 59 + '║'
+
 
 class PageContext(Enum):
     """Different contexts the operator can encounter"""
@@ -38,7 +71,83 @@ class PageContext(Enum):
     UNKNOWN = "❓ Unknown Page"
 
 
-@dataclass
+_CONTEXT_ORDINALS = {context: i for i, context in enumerate(PageContext)}
+_CONTEXTS = list(PageContext)
+
+
+def _json_default(obj):
+    """Fallback encoder for the stdlib json path (orjson handles datetimes natively)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class SessionLog:
+    """
+    Columnar (struct-of-arrays) session history.
+    One row per perception (urls/contexts/ts) and one row per action (actions/success),
+    instead of keeping every Perception/Thought object alive for the whole session.
+    """
+    __slots__ = ('urls', 'contexts', 'ts', 'actions', 'success')
+
+    def __init__(self):
+        self.urls: List[str] = []
+        self.contexts = array('B')  # PageContext ordinals
+        self.ts = array('d')  # epoch seconds
+        self.actions: List[str] = []
+        self.success = bytearray()
+
+    def record_perception(self, url: str, context: PageContext):
+        self.urls.append(url)
+        self.contexts.append(_CONTEXT_ORDINALS[context])
+        self.ts.append(time.time())
+
+    def record_action(self, action: str, success: bool):
+        self.actions.append(action)
+        self.success.append(success)
+
+    def summarize(self) -> Dict:
+        """Session analytics, computed column-wise with NumPy"""
+        import numpy as np
+
+        ts = np.frombuffer(self.ts, dtype=np.float64)
+        contexts = np.frombuffer(self.contexts, dtype=np.uint8)
+        ok = np.frombuffer(self.success, dtype=np.uint8).astype(bool)
+
+        # Action names -> categorical ids
+        names, action_ids = np.unique(np.array(self.actions, dtype=str), return_inverse=True)
+        attempts = np.bincount(action_ids, minlength=len(names))
+        successes = np.bincount(action_ids, weights=ok, minlength=len(names))
+
+        # Longest run of consecutive UNKNOWN pages
+        unknown = np.concatenate(([0], (contexts == _CONTEXT_ORDINALS[PageContext.UNKNOWN]).view(np.int8), [0]))
+        edges = np.diff(unknown)
+        streaks = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+
+        return {
+            "success_rate": float(ok.mean()) if ok.size else 0.0,
+            "mean_cycle_seconds": float(np.diff(ts).mean()) if ts.size > 1 else 0.0,
+            "longest_unknown_streak": int(streaks.max()) if streaks.size else 0,
+            "per_action": {
+                str(name): {"attempts": int(n), "successes": int(k)}
+                for name, n, k in zip(names, attempts, successes)
+            },
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "perceptions": [
+                {"url": url, "context": _CONTEXTS[ctx].name, "timestamp": datetime.fromtimestamp(ts)}
+                for url, ctx, ts in zip(self.urls, self.contexts, self.ts)
+            ],
+            "actions": [
+                {"action": action, "success": bool(ok)}
+                for action, ok in zip(self.actions, self.success)
+            ],
+        }
+
+
+@dataclass(slots=True, frozen=True)
 class Perception:
     """What the operator perceives"""
     url: str
@@ -47,10 +156,10 @@ class Perception:
     visible_inputs: List[str]
     visible_text: str
     context: PageContext
-    timestamp: datetime
+    timestamp: float  # time.monotonic()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Thought:
     """What the operator thinks"""
     observation: str
@@ -59,20 +168,82 @@ class Thought:
     suggested_action: str
 
 
+# Fills all known contact fields in a single CDP round-trip; returns how many were set
+_FILL_FORM_JS = """
+(data) => {
+    const setVal = (sel, v) => {
+        const e = document.querySelector(sel);
+        if (!e) return 0;
+        e.value = v;
+        e.dispatchEvent(new Event('input', {bubbles: true}));
+        e.dispatchEvent(new Event('change', {bubbles: true}));
+        return 1;
+    };
+    return setVal('input[type="email"], input[name*="email" i]', data.email)
+        + setVal('input[name*="name" i]:not([name*="last" i])', data.name)
+        + setVal('input[type="tel"], input[name*="phone" i]', data.phone);
+}
+"""
+
+# Contexts where the right action depends on the site's markup - worth remembering across runs
+_LEARNABLE_CONTEXTS = frozenset({PageContext.JOB_SEARCH_RESULTS, PageContext.JOB_DETAIL_PAGE, PageContext.UNKNOWN})
+
+# A learned action only breaks ties - it replaces heuristic guesses below this confidence,
+# never a decision backed by what is on the page (a visible Apply button, form fields)
+_RECALL_BELOW_CONFIDENCE = 0.9
+
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+_DEFAULT_MEMORY_PATH = os.path.expanduser('~/.autohire_ops.db')
+
+# Actions that change field values but not the page fingerprint - an unchanged DOM hash after them is expected
+_IN_PAGE_ACTIONS = frozenset({"fill_form_bulk", "fill_email", "fill_name", "fill_phone", "upload_cv"})
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _settle(page: Page, kind: str = 'click'):
+    """
+    Let the page settle after an action.
+    Clicks wait for the DOM to be ready (resumes as soon as it is, instead of a worst-case sleep);
+    in-page changes like fill/scroll only need a short safety pause.
+    """
+    if kind == 'click':
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            await page.wait_for_load_state('domcontentloaded', timeout=3000)
+        except PlaywrightTimeoutError:
+            pass
+    else:
+        await asyncio.sleep(0.2)
+
+
 class IntelligentAdaptiveOperator:
     """
     An operator that SEES, THINKS, and ACTS based on real-time observation
     No pre-scripted flows - pure adaptive intelligence
     """
 
-    def __init__(self, goal: str, cv_data: Dict):
+    def __init__(self, goal: str, cv_data: Dict, memory_path: str = _DEFAULT_MEMORY_PATH):
         self.goal = goal
         self.cv_data = cv_data
 
-        # Mental state
-        self.perceptions = []
-        self.thoughts = []
-        self.actions_taken = []
+        # Learned (domain, context) -> action preferences, persisted across runs.
+        # Opened by run_adaptive_loop, which also closes it
+        self._memory_path = memory_path
+        self._memory: Optional[shelve.Shelf] = None
+        self._pending_lesson = None  # (key, action, url, context) awaiting the next perception
+
+        # Mental state - full objects only for the current cycle, history is columnar
+        self.perception: Optional[Perception] = None
+        self.thought: Optional[Thought] = None
+        self._log = SessionLog()
         self.successful_patterns = []
         self.failed_patterns = []
 
@@ -83,14 +254,23 @@ class IntelligentAdaptiveOperator:
         # Adaptive parameters
         self.max_cycles = 15
         self.current_cycle = 0
+        self._run_id = datetime.now().strftime('%Y%m%d_%H%M%S')  # screenshot filename prefix
+
+        # Perception memoization - skip THINK when the DOM hasn't changed
+        self._last_dom_hash = None
+        self._last_thought = None
+
+        self._actions = self._build_actions()
+        self._locators: Dict[str, Locator] = {}
+        self._bulk_filled_urls = set()
 
     async def perceive(self, page: Page) -> Perception:
         """
         PERCEIVE - Actually observe and understand the environment
         """
-        logger.info("\n" + "═" * 80)
+        logger.info("\n%s", _BAR)
         logger.info("👁️  PERCEIVING ENVIRONMENT")
-        logger.info("═" * 80)
+        logger.info(_BAR)
 
         # Get page metadata
         url = page.url
@@ -130,17 +310,19 @@ class IntelligentAdaptiveOperator:
             visible_inputs=input_types,
             visible_text=visible_text,
             context=context,
-            timestamp=datetime.now()
+            timestamp=time.monotonic()
         )
 
-        self.perceptions.append(perception)
+        self.perception = perception
+        self._log.record_perception(url, context)
 
         # Log perception
-        logger.info(f"📄 Page: {title}")
-        logger.info(f"🔗 URL: {url}")
-        logger.info(f"🏷️  Context: {context.value}")
-        logger.info(f"🔘 Buttons: {len(button_texts)} visible ({', '.join(button_texts[:5])}...)")
-        logger.info(f"📝 Inputs: {len(input_types)} visible ({', '.join(input_types[:3])}...)")
+        logger.info("📄 Page: %s", title)
+        logger.info("🔗 URL: %s", url)
+        logger.info("🏷️  Context: %s", context.value)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔘 Buttons: %d visible (%s...)", len(button_texts), ', '.join(button_texts[:5]))
+            logger.info("📝 Inputs: %d visible (%s...)", len(input_types), ', '.join(input_types[:3]))
 
         return perception
 
@@ -171,13 +353,23 @@ class IntelligentAdaptiveOperator:
         else:
             return PageContext.UNKNOWN
 
+    @staticmethod
+    def _memory_key(perception: Perception) -> str:
+        return f"{urlparse(perception.url).netloc}|{perception.context.name}"
+
+    @staticmethod
+    def _log_decision(thought: Thought):
+        logger.info("\n💡 DECISION: %s", thought.suggested_action)
+        logger.info("📊 Confidence: %.0f%%", thought.confidence * 100)
+        logger.info("📝 Reasoning: %s", thought.reasoning)
+
     async def think(self, perception: Perception) -> Thought:
         """
         THINK - Reason about what we see and decide what to do
         """
-        logger.info("\n" + "═" * 80)
+        logger.info("\n%s", _BAR)
         logger.info("🧠 THINKING & REASONING")
-        logger.info("═" * 80)
+        logger.info(_BAR)
 
         thought = None
 
@@ -224,30 +416,20 @@ class IntelligentAdaptiveOperator:
             logger.info("💭 I'm on an application form!")
             logger.info("🎯 I need to fill in my details")
 
-            # Determine which field to fill
-            if any('email' in inp.lower() for inp in perception.visible_inputs):
-                logger.info("💡 I see an email field - filling it")
-                thought = Thought(
-                    observation="Email input field detected",
-                    reasoning="Forms typically require email first",
-                    confidence=0.9,
-                    suggested_action="fill_email"
-                )
-            elif any('name' in inp.lower() for inp in perception.visible_inputs):
-                logger.info("💡 I see a name field - filling it")
+            has_text_fields = any(
+                field in inp.lower()
+                for inp in perception.visible_inputs
+                for field in ('email', 'name', 'phone', 'tel')
+            )
+
+            # Fill every known text field in one go, then deal with the upload
+            if has_text_fields and perception.url not in self._bulk_filled_urls:
+                logger.info("💡 I see contact fields - filling them all at once")
                 thought = Thought(
-                    observation="Name input field detected",
-                    reasoning="Name is a required field",
+                    observation="Contact input fields detected",
+                    reasoning="Email, name and phone can be filled in a single pass",
                     confidence=0.9,
-                    suggested_action="fill_name"
-                )
-            elif any('phone' in inp.lower() for inp in perception.visible_inputs):
-                logger.info("💡 I see a phone field - filling it")
-                thought = Thought(
-                    observation="Phone input field detected",
-                    reasoning="Contact information needed",
-                    confidence=0.85,
-                    suggested_action="fill_phone"
+                    suggested_action="fill_form_bulk"
                 )
             elif any('file' in inp or 'resume' in inp.lower() or 'cv' in inp.lower() for inp in perception.visible_inputs):
                 logger.info("💡 I see a resume upload - uploading CV")
@@ -301,210 +483,350 @@ class IntelligentAdaptiveOperator:
                 suggested_action="screenshot_and_wait"
             )
 
-        self.thoughts.append(thought)
+        thought = self._recall(perception, thought)
 
-        logger.info(f"\n💡 DECISION: {thought.suggested_action}")
-        logger.info(f"📊 Confidence: {thought.confidence:.0%}")
-        logger.info(f"📝 Reasoning: {thought.reasoning}")
+        self.thought = thought
+        self._log_decision(thought)
 
         return thought
 
+    def _recall(self, perception: Perception, thought: Thought) -> Thought:
+        """Prefer what moved things along on this kind of page before, if the heuristics are unsure"""
+        if (self._memory is None or perception.context not in _LEARNABLE_CONTEXTS
+                or thought.confidence >= _RECALL_BELOW_CONFIDENCE):
+            return thought
+
+        preferred = self._memory.get(self._memory_key(perception))
+        if not preferred or preferred == thought.suggested_action or preferred in self.failed_patterns:
+            return thought
+
+        logger.info("💭 I've been on a page like this before")
+        logger.info("💡 Last time '%s' moved me forward here", preferred)
+        return Thought(
+            observation=f"Known {perception.context.name} page",
+            reasoning=f"Learned from a previous session (instead of '{thought.suggested_action}')",
+            confidence=_RECALL_BELOW_CONFIDENCE,
+            suggested_action=preferred
+        )
+
+    def _learn_from(self, perception: Perception):
+        """Remember the last action for its page only if it led to a new URL or context"""
+        if self._pending_lesson is None:
+            return
+        key, action, url, context = self._pending_lesson
+        self._pending_lesson = None
+        if perception.url != url or perception.context != context:
+            self._memory[key] = action
+
+    @staticmethod
+    def _dom_hash(perception: Perception) -> int:
+        """Cheap fingerprint of the interactive DOM (visible_text is data-fluid and excluded)"""
+        return hash((
+            perception.url,
+            perception.title,
+            tuple(perception.visible_buttons),
+            tuple(perception.visible_inputs),
+        ))
+
+    def _mutate_to_alternate(self, last_thought: Thought) -> Thought:
+        """
+        The page didn't change since the last cycle - no progress was made.
+        Pick a different action instead of re-thinking the same decision.
+        """
+        logger.info("🔁 No progress since last cycle - DOM unchanged, trying something different")
+
+        fallbacks = ["scroll_down", "click_apply_button", "click_first_job", "screenshot_and_wait"]
+        candidates = [a for a in fallbacks if a != last_thought.suggested_action]
+        untried = [a for a in candidates if a not in self.failed_patterns]
+        action = (untried or candidates)[0]
+
+        thought = Thought(
+            observation="Page unchanged since last action",
+            reasoning=f"'{last_thought.suggested_action}' made no progress",
+            confidence=0.5,
+            suggested_action=action
+        )
+        self.thought = thought
+        self._log_decision(thought)
+
+        return thought
+
+    def _build_actions(self) -> Dict[str, Callable[[Page], Awaitable[bool]]]:
+        """Action dispatch table - built once, handlers close over their selectors and values"""
+        first_name = self.cv_data['name'].split()[0]
+        return {
+            "click_first_job": self._do_click_first_job,
+            "click_apply_button": self._do_click_apply,
+            "scroll_down": self._do_scroll_down,
+            "fill_email": self._make_filler(
+                'email',
+                self.cv_data['email'],
+                f"⌨️  Filling email: {self.cv_data['email']}"
+            ),
+            "fill_name": self._make_filler(
+                'name',
+                first_name,
+                f"⌨️  Filling name: {self.cv_data['name']}"
+            ),
+            "fill_phone": self._make_filler(
+                'phone',
+                self.cv_data['phone'],
+                f"⌨️  Filling phone: {self.cv_data['phone']}"
+            ),
+            "fill_form_bulk": self._do_fill_form_bulk,
+            "upload_cv": self._do_upload_cv,
+            "screenshot_and_wait": self._do_screenshot_and_wait,
+            "pause_for_login": self._do_pause_for_login,
+            "goal_complete": self._do_goal_complete,
+        }
+
+    def _build_locators(self, page: Page) -> Dict[str, Locator]:
+        """Candidate selectors compiled into Locators once per page"""
+        return {
+            'job': page.locator('a[data-testid="job-title"], article a, .job-card a').first,
+            'apply': page.locator('button:has-text("Apply"), a:has-text("Apply"), button:has-text("Quick Apply")').first,
+            'email': page.locator('input[type="email"], input[name*="email" i]').first,
+            'name': page.locator('input[name*="name" i]:not([name*="last" i])').first,
+            'phone': page.locator('input[type="tel"], input[name*="phone" i]').first,
+            'file': page.locator('input[type="file"]').first,
+        }
+
+    def _make_filler(self, locator_key: str, value: str, message: str) -> Callable[[Page], Awaitable[bool]]:
+        """Build a handler that fills the field behind locator_key with value"""
+        async def handler(page: Page) -> bool:
+            logger.info(message)
+            field = self._locators[locator_key]
+            if not await field.count():
+                return False
+            await field.fill(value, timeout=2000)
+            await _settle(page, 'fill')
+            return True
+        return handler
+
+    async def _do_click_first_job(self, page: Page) -> bool:
+        logger.info("🖱️  Clicking on first job listing...")
+        job_link = self._locators['job']
+        if not await job_link.count():
+            logger.warning("⚠️  Could not find job link")
+            return False
+        await job_link.click(timeout=2000)
+        await _settle(page, 'click')
+        return True
+
+    async def _do_click_apply(self, page: Page) -> bool:
+        logger.info("🖱️  Clicking Apply button...")
+        apply_btn = self._locators['apply']
+        if not await apply_btn.count():
+            logger.warning("⚠️  Apply button not found")
+            return False
+        await apply_btn.click(timeout=2000)
+        await _settle(page, 'click')
+        return True
+
+    async def _do_scroll_down(self, page: Page) -> bool:
+        logger.info("📜 Scrolling down...")
+        await page.evaluate("window.scrollBy(0, 500)")
+        await _settle(page, 'scroll')
+        return True
+
+    async def _do_fill_form_bulk(self, page: Page) -> bool:
+        logger.info("⌨️  Filling form: %s / %s / %s", self.cv_data['name'], self.cv_data['email'], self.cv_data['phone'])
+        filled = await page.evaluate(_FILL_FORM_JS, {
+            'email': self.cv_data['email'],
+            'name': self.cv_data['name'].split()[0],
+            'phone': self.cv_data['phone'],
+        })
+        self._bulk_filled_urls.add(page.url)
+        logger.info("📝 Filled %d field(s)", filled)
+        await _settle(page, 'fill')
+        return filled > 0
+
+    async def _do_upload_cv(self, page: Page) -> bool:
+        logger.info("📎 Uploading CV: %s", self.cv_data['cv_path'])
+        file_input = self._locators['file']
+        if not await file_input.count():
+            return False
+        await file_input.set_input_files(self.cv_data['cv_path'], timeout=2000)
+        await _settle(page, 'fill')
+        return True
+
+    async def _do_screenshot_and_wait(self, page: Page) -> bool:
+        logger.info("📸 Taking screenshot...")
+        await page.screenshot(path=f"unknown_state_{self._run_id}_{self.current_cycle}.png")
+        await _settle(page, 'click')
+        return True
+
+    async def _do_pause_for_login(self, page: Page) -> bool:
+        logger.info("⏸️  Pausing for manual login...")
+        logger.info("💡 Please log in manually, then press Enter")
+        await asyncio.sleep(30)  # Give time for manual login
+        return True
+
+    async def _do_goal_complete(self, page: Page) -> bool:
+        logger.info("🎉 Goal achieved!")
+        await page.screenshot(path=f"confirmation_{self._run_id}_{self.current_cycle}.png")
+        return True
+
     async def act(self, page: Page, thought: Thought) -> bool:
         """
         ACT - Execute the decided action
         """
-        logger.info("\n" + "═" * 80)
+        logger.info("\n%s", _BAR)
         logger.info("⚡ EXECUTING ACTION")
-        logger.info("═" * 80)
+        logger.info(_BAR)
 
         action = thought.suggested_action
-        success = False
+        handler = self._actions.get(action)
 
         try:
-            if action == "click_first_job":
-                logger.info("🖱️  Clicking on first job listing...")
-                # Try multiple selectors
-                job_link = await page.query_selector('a[data-testid="job-title"], article a, .job-card a')
-                if job_link:
-                    await job_link.click()
-                    await asyncio.sleep(3)
-                    success = True
-                else:
-                    logger.warning("⚠️  Could not find job link")
-
-            elif action == "click_apply_button":
-                logger.info("🖱️  Clicking Apply button...")
-                apply_btn = await page.query_selector('button:has-text("Apply"), a:has-text("Apply"), button:has-text("Quick Apply")')
-                if apply_btn:
-                    await apply_btn.click()
-                    await asyncio.sleep(3)
-                    success = True
-                else:
-                    logger.warning("⚠️  Apply button not found")
-
-            elif action == "scroll_down":
-                logger.info("📜 Scrolling down...")
-                await page.evaluate("window.scrollBy(0, 500)")
-                await asyncio.sleep(2)
-                success = True
-
-            elif action == "fill_email":
-                logger.info(f"⌨️  Filling email: {self.cv_data['email']}")
-                email_field = await page.query_selector('input[type="email"], input[name*="email" i]')
-                if email_field:
-                    await email_field.fill(self.cv_data['email'])
-                    await asyncio.sleep(1)
-                    success = True
-
-            elif action == "fill_name":
-                logger.info(f"⌨️  Filling name: {self.cv_data['name']}")
-                name_field = await page.query_selector('input[name*="name" i]:not([name*="last" i])')
-                if name_field:
-                    first_name = self.cv_data['name'].split()[0]
-                    await name_field.fill(first_name)
-                    await asyncio.sleep(1)
-                    success = True
-
-            elif action == "fill_phone":
-                logger.info(f"⌨️  Filling phone: {self.cv_data['phone']}")
-                phone_field = await page.query_selector('input[type="tel"], input[name*="phone" i]')
-                if phone_field:
-                    await phone_field.fill(self.cv_data['phone'])
-                    await asyncio.sleep(1)
-                    success = True
-
-            elif action == "upload_cv":
-                logger.info(f"📎 Uploading CV: {self.cv_data['cv_path']}")
-                file_input = await page.query_selector('input[type="file"]')
-                if file_input:
-                    await file_input.set_input_files(self.cv_data['cv_path'])
-                    await asyncio.sleep(2)
-                    success = True
-
-            elif action == "screenshot_and_wait":
-                logger.info("📸 Taking screenshot...")
-                await page.screenshot(path=f"unknown_state_{datetime.now().strftime('%H%M%S')}.png")
-                await asyncio.sleep(2)
-                success = True
-
-            elif action == "pause_for_login":
-                logger.info("⏸️  Pausing for manual login...")
-                logger.info("💡 Please log in manually, then press Enter")
-                await asyncio.sleep(30)  # Give time for manual login
-                success = True
-
-            elif action == "goal_complete":
-                logger.info("🎉 Goal achieved!")
-                await page.screenshot(path=f"confirmation_{datetime.now().strftime('%H%M%S')}.png")
-                success = True
-
+            if handler:
+                success = await handler(page)
             else:
-                logger.warning(f"⚠️  Unknown action: {action}")
-
-            self.actions_taken.append({
-                "action": action,
-                "success": success,
-                "timestamp": datetime.now().isoformat()
-            })
+                logger.warning("⚠️  Unknown action: %s", action)
+                success = False
 
             if success:
                 logger.info("✅ Action completed successfully")
             else:
                 logger.info("❌ Action failed")
 
-            return success
-
         except Exception as e:
-            logger.error(f"❌ Error executing action: {e}")
-            return False
+            logger.error("❌ Error executing action: %s", e)
+            success = False
 
-    async def run_adaptive_loop(self, starting_url: str):
+        self._log.record_action(action, success)
+        return success
+
+    async def run_adaptive_loop(self, starting_url: str, headless: bool = True, user_data_dir: str = '.pw_profile'):
         """
         Main intelligence loop: PERCEIVE -> THINK -> ACT -> REPEAT
-        """
-        logger.info("=" * 80)
-        logger.info("🧠 INTELLIGENT ADAPTIVE OPERATOR - STARTING")
-        logger.info("=" * 80)
-        logger.info(f"\n🎯 GOAL: {self.goal}")
-        logger.info(f"👤 Candidate: {self.cv_data['name']}")
-        logger.info(f"📧 Email: {self.cv_data['email']}\n")
-
-        # Start browser
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=False, args=['--start-maximized'])
-        page = await browser.new_page(viewport={'width': 1920, 'height': 1080})
-
-        logger.info(f"🌐 Navigating to: {starting_url}\n")
-        await page.goto(starting_url)
-        await asyncio.sleep(3)
-
-        logger.info("🔄 ENTERING ADAPTIVE INTELLIGENCE LOOP")
-        logger.info("=" * 80)
-
-        while not self.goal_achieved and self.current_cycle < self.max_cycles:
-            self.current_cycle += 1
 
-            logger.info(f"\n{'╔'+ '═' * 78 + '╗'}")
-            logger.info(f"║  CYCLE #{self.current_cycle}/{self.max_cycles} {'': <65}║")
-            logger.info(f"{'╚'+ '═' * 78 + '╝'}")
+        The browser profile in user_data_dir (cookies, HTTP cache) survives between runs,
+        so repeat runs start warm.
+        """
+        self._run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._memory = shelve.open(self._memory_path)
 
-            # PERCEIVE
-            perception = await self.perceive(page)
+        try:
+            logger.info(_RULE)
+            logger.info("🧠 INTELLIGENT ADAPTIVE OPERATOR - STARTING")
+            logger.info(_RULE)
+            logger.info("\n🎯 GOAL: %s", self.goal)
+            logger.info("👤 Candidate: %s", self.cv_data['name'])
+            logger.info("📧 Email: %s\n", self.cv_data['email'])
+
+            # Start browser (imported here so the operator can be used without paying for playwright)
+            from playwright.async_api import async_playwright
+
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch_persistent_context(
+                user_data_dir=user_data_dir,
+                headless=headless,
+                viewport={'width': 1920, 'height': 1080},
+                args=['--disable-blink-features=AutomationControlled']
+            )
+            page = browser.pages[0] if browser.pages else await browser.new_page()
+            # The operator reads the DOM, not pixels - skip heavy assets
+            await page.route('**/*', _block_heavy_resources)
+            self._locators = self._build_locators(page)
 
-            # THINK
-            thought = await self.think(perception)
+            logger.info("🌐 Navigating to: %s\n", starting_url)
+            await page.goto(starting_url, wait_until='domcontentloaded')
 
-            # ACT
-            success = await self.act(page, thought)
+            logger.info("🔄 ENTERING ADAPTIVE INTELLIGENCE LOOP")
+            logger.info(_RULE)
 
-            # LEARN
-            if success:
-                logger.info("\n📚 LEARNING: Action pattern successful")
-                self.successful_patterns.append(thought.suggested_action)
-            else:
-                logger.info("\n📚 LEARNING: Action failed, will try different approach")
-                self.failed_patterns.append(thought.suggested_action)
+            while not self.goal_achieved and self.current_cycle < self.max_cycles:
+                self.current_cycle += 1
 
-            # Check goal
-            if self.goal_achieved:
-                logger.info(f"\n{'╔' + '═' * 78 + '╗'}")
-                logger.info(f"║  🎉 GOAL ACHIEVED! {'': <62}║")
-                logger.info(f"{'╚' + '═' * 78 + '╝'}")
-                break
+                logger.info("\n%s", _TOP)
+                logger.info(_CYCLE_LINE, self.current_cycle, self.max_cycles)
+                logger.info(_BOT)
 
-            # Pause between cycles
-            await asyncio.sleep(3)
+                # PERCEIVE
+                perception = await self.perceive(page)
+                self._learn_from(perception)
 
-        # Summary
-        logger.info(f"\n{'=' * 80}")
-        logger.info("📊 SESSION SUMMARY")
-        logger.info("=" * 80)
-        logger.info(f"Cycles completed: {self.current_cycle}")
-        logger.info(f"Perceptions made: {len(self.perceptions)}")
-        logger.info(f"Decisions made: {len(self.thoughts)}")
-        logger.info(f"Actions taken: {len(self.actions_taken)}")
-        logger.info(f"Goal achieved: {'YES ✅' if self.goal_achieved else 'NO ❌'}")
-        logger.info(f"\n💡 Browser staying open for review...")
-        logger.info("   Press Ctrl+C to close\n")
-
-        await asyncio.sleep(3600)
-
-        await browser.close()
-        await playwright.stop()
+                # THINK (reuse the last decision's context if nothing changed)
+                dom_hash = self._dom_hash(perception)
+                if (dom_hash == self._last_dom_hash and self._last_thought is not None
+                        and self._last_thought.suggested_action not in _IN_PAGE_ACTIONS):
+                    thought = self._mutate_to_alternate(self._last_thought)
+                else:
+                    thought = await self.think(perception)
+                self._last_dom_hash = dom_hash
+                self._last_thought = thought
+
+                # ACT
+                success = await self.act(page, thought)
+
+                # LEARN
+                if success:
+                    logger.info("\n📚 LEARNING: Action pattern successful")
+                    self.successful_patterns.append(thought.suggested_action)
+                    # Kept only if the next perception shows it moved the page on
+                    if perception.context in _LEARNABLE_CONTEXTS:
+                        self._pending_lesson = (self._memory_key(perception), thought.suggested_action,
+                                                perception.url, perception.context)
+                else:
+                    logger.info("\n📚 LEARNING: Action failed, will try different approach")
+                    self.failed_patterns.append(thought.suggested_action)
+
+                # Check goal
+                if self.goal_achieved:
+                    logger.info("\n%s", _TOP)
+                    logger.info(_GOAL_LINE)
+                    logger.info(_BOT)
+                    break
+
+            # Summary
+            logger.info("\n%s", _RULE)
+            logger.info("📊 SESSION SUMMARY")
+            logger.info(_RULE)
+            logger.info("Cycles completed: %d", self.current_cycle)
+            logger.info("Perceptions made: %d", len(self._log.urls))
+            logger.info("Actions taken: %d", len(self._log.actions))
+            logger.info("Actions succeeded: %d", sum(self._log.success))
+            logger.info("Goal achieved: %s", 'YES ✅' if self.goal_achieved else 'NO ❌')
+
+            stats = self._log.summarize()
+            logger.info("Success rate: %.0f%%", stats["success_rate"] * 100)
+            logger.info("Avg cycle time: %.1fs", stats["mean_cycle_seconds"])
+            logger.info("Longest unknown-page streak: %d", stats["longest_unknown_streak"])
+            for action, counts in stats["per_action"].items():
+                logger.info("  %s: %d/%d", action, counts["successes"], counts["attempts"])
+
+            # Save session log
+            session_file = Path(f"session_{self._run_id}.json")
+            session_file.write_bytes(_dumps({
+                "goal": self.goal,
+                "goal_achieved": self.goal_achieved,
+                "cycles": self.current_cycle,
+                "summary": stats,
+                **self._log.to_dict()
+            }))
+            logger.info("\n💾 Session saved: %s", session_file)
+            if not headless:
+                logger.info("\n💡 Browser staying open for review...")
+                logger.info("   Press Ctrl+C to close\n")
+                await wait_for_shutdown()
+
+            await browser.close()
+            await playwright.stop()
+        finally:
+            self._memory.close()
+            self._memory = None
 
 
 async def main():
-    # Load CV
-    with open("sample_cv.txt", 'r') as f:
-        cv_text = f.read()
-
-    import re
-    cv_data = {
-        "name": cv_text.split('\n')[0],
-        "email": re.search(r'[\w\.-]+@[\w\.-]+\.\w+', cv_text).group(0),
-        "phone": re.search(r'\(\d{3}\)\s*\d{3}-\d{4}', cv_text).group(0),
-        "cv_path": str(Path("sample_cv.txt").absolute())
-    }
+    # Load CV - scan the mapped file instead of decoding all of it
+    with open("sample_cv.txt", 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as cv:
+        cv_data = {
+            "name": cv.readline().decode().rstrip(),
+            "email": _EMAIL_RE.search(cv).group(0).decode(),
+            "phone": _PHONE_RE.search(cv).group(0).decode(),
+            "cv_path": str(Path("sample_cv.txt").absolute())
+        }
 
     operator = IntelligentAdaptiveOperator(
         goal="Apply to a Full Stack Developer job",
@@ -520,9 +842,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    logger.info("=" * 80)
+    logger.info(_RULE)
     logger.info("🧠 INTELLIGENT ADAPTIVE OPERATOR")
-    logger.info("=" * 80)
+    logger.info(_RULE)
     logger.info("\nThis operator ACTUALLY:")
     logger.info("  • Observes the real environment (DOM, buttons, inputs)")
     logger.info("  • Understands context (job listing vs application form)")
@@ -530,6 +852,6 @@ if __name__ == "__main__":
     logger.info("  • Acts based on intelligent decisions")
     logger.info("  • Adapts when things don't work")
     logger.info("  • Learns successful patterns\n")
-    logger.info("=" * 80 + "\n")
+    logger.info("%s\n", _RULE)
 
     asyncio.run(main())
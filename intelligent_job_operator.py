@@ -8,22 +8,121 @@ Intelligent Job Application Operator
 - Demonstrates thought process at every step
 """
 import asyncio
+import os
 import sys
+import time
 from pathlib import Path
 import logging
 from datetime import datetime
 from typing import Dict, List, Any
-import json
+from urllib.parse import urljoin, urlparse
+
+try:
+    import ahocorasick
+except ImportError:  # optional - plain substring scan is used instead
+    ahocorasick = None
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dumps_line(obj) -> bytes:
+        return json.dumps(obj).encode() + b"\n"
 
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError
 from backend.app.services.cv_analysis_service import CVAnalysisService
 from backend.app.services.cv_generator_service import CVGeneratorService
 
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+SEP = "=" * 80
+
+
+def _append_bytes(path: Path, data: bytes):
+    with open(path, 'ab') as f:
+        f.write(data)
+
+
+def _normalize_url(url: str) -> str:
+    """URL without query string/fragment (tracking params differ between listings of the same job)"""
+    return urlparse(url)._replace(query='', fragment='').geturl()
+
+
+# Job description containers, in priority order
+DESCRIPTION_SELECTORS = [
+    '[data-automation="jobAdDetails"]',  # Seek
+    '.show-more-less-html__markup',  # LinkedIn
+    '#jobDescriptionText',  # Indeed
+    '.jobsearch-jobDescriptionText',  # Indeed alt
+    '[class*="description"]',  # Generic
+]
+
+# Company name elements, in priority order
+COMPANY_SELECTORS = [
+    '[data-automation="advertiser-name"]',  # Seek
+    '.jobs-unified-top-card__company-name',  # LinkedIn
+    '[data-testid="company-name"]',  # Indeed
+    '[class*="company"]',  # Generic
+]
+
+# Text of the first element matching each selector list (null if none match)
+EXTRACT_DETAILS_JS = """
+(sels) => {
+    const find = (list) => {
+        for (const s of list) {
+            const el = document.querySelector(s);
+            if (el) return el.innerText;
+        }
+        return null;
+    };
+    return {description: find(sels.desc) || '', company: find(sels.company)};
+}
+"""
+
+
+# Cookie banners / modals worth closing before extraction
+POPUP_SELECTORS = [
+    'button:has-text("Accept")',
+    'button:has-text("Got it")',
+    'button:has-text("Close")',
+    'button[aria-label="Close"]',
+    '#onetrust-accept-btn-handler',
+]
+
+# Title/href of the first 10 job links on a search results page
+EXTRACT_JOB_LINKS_JS = """
+(sel) => {
+    const links = Array.from(document.querySelectorAll(sel));
+    return {
+        total: links.length,
+        links: links.slice(0, 10).map(a => ({title: a.innerText.trim(), href: a.getAttribute('href')})),
+    };
+}
+"""
+
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class JobPlatform:
     """Platform configurations"""
@@ -63,36 +162,59 @@ class IntelligentJobOperator:
     6. Demonstrates reasoning throughout
     """
 
+    # Reusable pages on the shared browser context - also bounds how many pages load at once
+    PAGE_POOL_SIZE = 5
+
+    # Browser profile reused across runs
+    PROFILE_DIR = '.pw_profile_jobs'
+
     def __init__(self, cv_path: str):
         self.cv_path = Path(cv_path).absolute()
         self.cv_analysis_service = CVAnalysisService()
         self.cv_generator_service = CVGeneratorService()
 
         self.cv_analysis = None
+        self._skills_lc = ()  # CV skills, lowercased once after analysis
+        self._skill_automaton = None  # Aho-Corasick automaton over _skills_lc (if pyahocorasick is installed)
         self.playwright = None
         self.browser = None
         self.context = None
+        self._page_pool: asyncio.Queue = asyncio.Queue()
 
-        self.thought_log = []
+        # Thought log as parallel columns: epoch timestamp, phase, message
+        self._thought_ts: List[float] = []
+        self._thought_phase: List[str] = []
+        self._thought_msg: List[str] = []
         self.results = []
+        self.run_ts = datetime.now().strftime('%Y%m%d_%H%M%S')  # shared by every file this run writes
+
+        # Results are streamed to a .jsonl file as they complete (see _write_results)
+        self._results_queue: asyncio.Queue = asyncio.Queue()
+        self._results_writer = None
 
     async def initialize(self):
         """Initialize operator and analyze CV"""
-        logger.info("\n" + "=" * 80)
+        logger.info("\n%s", SEP)
         logger.info("🤖 INTELLIGENT JOB APPLICATION OPERATOR")
-        logger.info("=" * 80)
+        logger.info(SEP)
 
         # Step 1: Analyze CV
         self._log_thought("STEP 1", "Analyzing CV to understand candidate profile")
         self.cv_analysis = self.cv_analysis_service.analyze_cv(str(self.cv_path))
+        self._skills_lc = tuple(s.lower() for s in self.cv_analysis['skills'])
+        if ahocorasick is not None and self._skills_lc:
+            self._skill_automaton = ahocorasick.Automaton()
+            for index, skill_lc in enumerate(self._skills_lc):
+                self._skill_automaton.add_word(skill_lc, index)
+            self._skill_automaton.make_automaton()
 
         personal = self.cv_analysis['personal_info']
-        logger.info(f"\n👤 Candidate Profile:")
-        logger.info(f"   Name: {personal['name']}")
-        logger.info(f"   Title: {personal['title']}")
-        logger.info(f"   Location: {personal['location']}")
-        logger.info(f"   Skills: {', '.join(self.cv_analysis['skills'][:10])}")
-        logger.info(f"   Search Keywords: {', '.join(self.cv_analysis['keywords'][:5])}")
+        logger.info("\n👤 Candidate Profile:")
+        logger.info("   Name: %s", personal['name'])
+        logger.info("   Title: %s", personal['title'])
+        logger.info("   Location: %s", personal['location'])
+        logger.info("   Skills: %s", ', '.join(self.cv_analysis['skills'][:10]))
+        logger.info("   Search Keywords: %s", ', '.join(self.cv_analysis['keywords'][:5]))
 
         self._log_thought(
             "ANALYSIS",
@@ -104,25 +226,63 @@ class IntelligentJobOperator:
         # Step 2: Initialize browser
         self._log_thought("STEP 2", "Initializing browser automation")
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=False,
-            args=['--start-maximized']
-        )
-
-        self.context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
+        # Persistent profile: cookies, consent choices and HTTP cache carry over between runs
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            user_data_dir=self.PROFILE_DIR,
+            headless=not os.getenv('JOB_OP_HEADED'),  # set JOB_OP_HEADED=1 to watch the browser
+            viewport={'width': 1920, 'height': 1080},  # desktop layout so selectors match
             locale='en-AU',
             timezone_id='Australia/Melbourne',
+            args=[
+                '--disable-blink-features=AutomationControlled',
+                '--no-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-gpu',
+                '--no-zygote',
+            ]
         )
+        self.browser = self.context.browser  # None for persistent contexts
+        # Only page text is read - don't download images, fonts or styles
+        await self.context.route("**/*", _block_heavy_resources)
+
+        pages = list(self.context.pages[:self.PAGE_POOL_SIZE])  # the persistent context opens with a blank page
+        while len(pages) < self.PAGE_POOL_SIZE:
+            pages.append(await self.context.new_page())
+        for page in pages:
+            self._page_pool.put_nowait(page)
 
         logger.info("✅ Browser ready for job search")
 
+    async def _release_page(self, page: Page):
+        """Blank a pooled page (drops the previous document) and hand it back"""
+        try:
+            await page.goto("about:blank")
+        except Exception as e:
+            logger.debug("Error resetting page: %s", e)
+        self._page_pool.put_nowait(page)
+
+    @staticmethod
+    def _format_thought(ts: float, phase: str, msg: str) -> str:
+        return f"[{time.strftime('%H:%M:%S', time.localtime(ts))}] [{phase}] {msg}"
+
+    async def _write_results(self, path: Path):
+        """Background task: append each queued result to path until a None sentinel arrives"""
+        while (result := await self._results_queue.get()) is not None:
+            await asyncio.to_thread(_append_bytes, path, _dumps_line(result))
+
+    def _record_result(self, results: List[Dict], result: Dict):
+        results.append(result)
+        if self._results_writer:
+            self._results_queue.put_nowait(result)
+
     def _log_thought(self, phase: str, thought: str):
         """Log operator's thought process"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] [{phase}] {thought}"
-        self.thought_log.append(entry)
-        logger.info(f"\n💭 {entry}")
+        ts = time.time()
+        self._thought_ts.append(ts)
+        self._thought_phase.append(phase)
+        self._thought_msg.append(thought)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n💭 %s", self._format_thought(ts, phase, thought))
 
     async def search_jobs(self, platform_config: Dict, keywords: List[str]) -> List[Dict]:
         """
@@ -132,9 +292,9 @@ class IntelligentJobOperator:
             List of job dictionaries with title, company, url, description
         """
         platform_name = platform_config['name']
-        logger.info("\n" + "=" * 80)
-        logger.info(f"🔍 SEARCHING {platform_name.upper()}")
-        logger.info("=" * 80)
+        logger.info("\n%s", SEP)
+        logger.info("🔍 SEARCHING %s", platform_name.upper())
+        logger.info(SEP)
 
         # Use top keywords for search
         search_term = " ".join(keywords[:3])  # Top 3 keywords
@@ -143,7 +303,7 @@ class IntelligentJobOperator:
             f"Searching {platform_name} for: '{search_term}'"
         )
 
-        page = await self.context.new_page()
+        page = await self._page_pool.get()
 
         # Build search URL
         search_url = platform_config["search_url"].format(
@@ -151,11 +311,15 @@ class IntelligentJobOperator:
             location="Melbourne"
         )
 
-        logger.info(f"📍 URL: {search_url}")
+        logger.info("📍 URL: %s", search_url)
 
         try:
             await page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(3)
+            try:
+                # Continue as soon as the listings are in the DOM
+                await page.wait_for_selector(platform_config["job_link_selector"], state="attached", timeout=8000)
+            except PlaywrightTimeoutError:
+                logger.debug("No job links on %s after 8s, extracting anyway", platform_name)
 
             # Handle popups
             await self._dismiss_popups(page)
@@ -168,45 +332,38 @@ class IntelligentJobOperator:
 
             jobs = []
             try:
-                job_elements = await page.query_selector_all(platform_config["job_link_selector"])
-                logger.info(f"   Found {len(job_elements)} job listings")
-
-                for i, element in enumerate(job_elements[:10], 1):  # Get up to 10
-                    try:
-                        href = await element.get_attribute('href')
-                        title = await element.inner_text()
-
-                        if href:
-                            # Make absolute URL
-                            if href.startswith('/'):
-                                base_url = f"https://{page.url.split('/')[2]}"
-                                href = base_url + href
-
-                            jobs.append({
-                                'title': title.strip(),
-                                'url': href,
-                                'platform': platform_name,
-                                'company': 'Unknown',  # Will extract on detail page
-                                'description': ''  # Will extract on detail page
-                            })
-
-                            logger.info(f"   {i}. {title.strip()}")
-
-                    except Exception as e:
-                        logger.debug(f"Error extracting job {i}: {e}")
+                cards = await page.evaluate(EXTRACT_JOB_LINKS_JS, platform_config["job_link_selector"])
+                logger.info("   Found %s job listings", cards['total'])
+
+                for i, card in enumerate(cards['links'], 1):
+                    if not card['href']:
                         continue
 
+                    # Make absolute URL (handles relative and protocol-relative links)
+                    href = urljoin(page.url, card['href'])
+
+                    jobs.append({
+                        'title': card['title'],
+                        'url': href,
+                        'platform': platform_name,
+                        'company': 'Unknown',  # Will extract on detail page
+                        'description': ''  # Will extract on detail page
+                    })
+
+                    logger.info("   %s. %s", i, card['title'])
+
             except Exception as e:
-                logger.error(f"Error extracting jobs: {e}")
+                logger.error("Error extracting jobs: %s", e)
 
-            await page.close()
             return jobs
 
         except Exception as e:
-            logger.error(f"Search failed: {e}")
-            await page.close()
+            logger.error("Search failed: %s", e)
             return []
 
+        finally:
+            await self._release_page(page)
+
     async def get_job_details(self, job: Dict) -> Dict:
         """
         Get detailed information about a job
@@ -214,76 +371,81 @@ class IntelligentJobOperator:
         Returns:
             Updated job dict with description
         """
-        page = await self.context.new_page()
+        page = await self._page_pool.get()
 
         try:
             await page.goto(job['url'], wait_until="domcontentloaded", timeout=20000)
-            await asyncio.sleep(2)
+            try:
+                # Continue as soon as any known description container is in the DOM
+                await page.locator(", ".join(DESCRIPTION_SELECTORS)).first.wait_for(state="attached", timeout=6000)
+            except PlaywrightTimeoutError:
+                logger.debug("No description container after 6s: %s", job['url'])
 
             await self._dismiss_popups(page)
 
-            # Extract job description
-            description = ""
-            desc_selectors = [
-                '[data-automation="jobAdDetails"]',  # Seek
-                '.show-more-less-html__markup',  # LinkedIn
-                '#jobDescriptionText',  # Indeed
-                '.jobsearch-jobDescriptionText',  # Indeed alt
-                '[class*="description"]',  # Generic
-            ]
-
-            for selector in desc_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        description = await element.inner_text()
-                        break
-                except:
-                    continue
+            # Extract description and company in one round-trip
+            details = await page.evaluate(EXTRACT_DETAILS_JS, {
+                "desc": DESCRIPTION_SELECTORS,
+                "company": COMPANY_SELECTORS,
+            })
 
-            job['description'] = description[:1000]  # First 1000 chars
-
-            # Extract company if available
-            company_selectors = [
-                '[data-automation="advertiser-name"]',  # Seek
-                '.jobs-unified-top-card__company-name',  # LinkedIn
-                '[data-testid="company-name"]',  # Indeed
-                '[class*="company"]',  # Generic
-            ]
-
-            for selector in company_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        job['company'] = (await element.inner_text()).strip()
-                        break
-                except:
-                    continue
+            job['description'] = details['description'][:1000]  # First 1000 chars
+            if details['company']:
+                job['company'] = details['company'].strip()
 
         except Exception as e:
-            logger.debug(f"Error getting job details: {e}")
+            logger.debug("Error getting job details: %s", e)
+
+        finally:
+            await self._release_page(page)
 
-        await page.close()
         return job
 
     async def _dismiss_popups(self, page: Page):
         """Dismiss any popups or cookie banners"""
-        popup_selectors = [
-            'button:has-text("Accept")',
-            'button:has-text("Got it")',
-            'button:has-text("Close")',
-            'button[aria-label="Close"]',
-            '#onetrust-accept-btn-handler'
-        ]
-
-        for selector in popup_selectors:
-            try:
-                element = await page.wait_for_selector(selector, timeout=2000)
-                if element:
-                    await element.click()
-                    await asyncio.sleep(0.5)
-            except:
-                continue
+        # One combined probe with a single timeout budget, instead of waiting on each selector in turn
+        probe = page.locator(", ".join(POPUP_SELECTORS)).first
+        try:
+            await probe.click(timeout=1500)
+        except PlaywrightTimeoutError:
+            pass  # No popup
+        except Exception as e:
+            logger.debug("Could not dismiss popup: %s", e)
+
+    def _match_skills(self, text_lc: str) -> List[str]:
+        """CV skills occurring in a lowercased text, in CV order - one pass with Aho-Corasick when available"""
+        if self._skill_automaton is not None:
+            indices = {index for _, index in self._skill_automaton.iter(text_lc)}
+        else:
+            indices = {index for index, skill_lc in enumerate(self._skills_lc) if skill_lc in text_lc}
+        return [self.cv_analysis['skills'][index] for index in sorted(indices)]
+
+    def preselect_jobs(self, jobs: List[Dict], limit: int) -> List[Dict]:
+        """
+        Drop cross-posted duplicates and keep the jobs whose titles best match the CV,
+        so detail pages are only fetched for likely candidates
+        """
+        seen = set()
+        unique_jobs = []
+        for job in jobs:
+            key = _normalize_url(job['url'])
+            if key not in seen:
+                seen.add(key)
+                unique_jobs.append(job)
+
+        # Title-only score: how many CV skills the title mentions (no network, one automaton pass each)
+        ranked = sorted(
+            ((len(self._match_skills(job['title'].lower())), job) for job in unique_jobs),
+            key=lambda pair: pair[0],
+            reverse=True
+        )
+
+        self._log_thought(
+            "PRESELECT",
+            f"{len(jobs) - len(unique_jobs)} duplicate listings removed; "
+            f"keeping top {min(limit, len(ranked))} of {len(ranked)} by skills named in the title"
+        )
+        return [job for _, job in ranked[:limit]]
 
     def rank_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """
@@ -292,9 +454,9 @@ class IntelligentJobOperator:
         Returns:
             Sorted list of jobs with relevance scores
         """
-        logger.info("\n" + "=" * 80)
+        logger.info("\n%s", SEP)
         logger.info("📊 RANKING JOBS BY RELEVANCE")
-        logger.info("=" * 80)
+        logger.info(SEP)
 
         self._log_thought(
             "RANKING",
@@ -309,15 +471,15 @@ class IntelligentJobOperator:
             )
             job['relevance_score'] = score
 
-            logger.info(f"   {job['title'][:50]:50} | Relevance: {score:.1f}%")
+            logger.info("   %-50s | Relevance: %.1f%%", job['title'][:50], score)
 
         # Sort by relevance
         ranked_jobs = sorted(jobs, key=lambda x: x['relevance_score'], reverse=True)
 
+        top_scores = ', '.join(f"{j['relevance_score']:.0f}%" for j in ranked_jobs[:5])
         self._log_thought(
             "DECISION",
-            f"Selected top 5 jobs with relevance scores: "
-            f"{', '.join([f'{j[\"relevance_score\"]:.0f}%' for j in ranked_jobs[:5]])}"
+            f"Selected top 5 jobs with relevance scores: {top_scores}"
         )
 
         return ranked_jobs
@@ -329,18 +491,20 @@ class IntelligentJobOperator:
         Returns:
             List of application results
         """
-        logger.info("\n" + "=" * 80)
+        logger.info("\n%s", SEP)
         logger.info("📝 CREATING TAILORED CVS AND APPLYING")
-        logger.info("=" * 80)
+        logger.info(SEP)
 
         results = []
+        top_jobs = jobs[:5]  # Top 5 jobs
+        cv_output_paths = []
 
-        for i, job in enumerate(jobs[:5], 1):  # Top 5 jobs
-            logger.info(f"\n{'=' * 80}")
-            logger.info(f"JOB {i}/5: {job['title']}")
-            logger.info(f"Company: {job['company']}")
-            logger.info(f"Relevance: {job['relevance_score']:.1f}%")
-            logger.info(f"{'=' * 80}")
+        for i, job in enumerate(top_jobs, 1):
+            logger.info("\n%s", SEP)
+            logger.info("JOB %s/5: %s", i, job['title'])
+            logger.info("Company: %s", job['company'])
+            logger.info("Relevance: %.1f%%", job['relevance_score'])
+            logger.info(SEP)
 
             self._log_thought(
                 f"JOB-{i}",
@@ -348,76 +512,90 @@ class IntelligentJobOperator:
             )
 
             # Generate tailored CV
+            matched_skills = self._match_skills(job['description'].lower())[:3]
             self._log_thought(
                 f"CV-GEN-{i}",
-                f"Generating tailored CV emphasizing relevant skills: "
-                f"{', '.join([s for s in self.cv_analysis['skills'] if s.lower() in job['description'].lower()][:3])}"
+                f"Generating tailored CV emphasizing relevant skills: {', '.join(matched_skills)}"
             )
 
-            cv_filename = f"cv_tailored_{job['platform']}_{i}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-            cv_output_path = Path("generated_cvs") / cv_filename
-
-            try:
-                cv_result = self.cv_generator_service.generate_tailored_cv(
-                    self.cv_analysis,
-                    job,
-                    str(cv_output_path)
-                )
-
-                self._log_thought(
-                    f"CV-COMPLETE-{i}",
-                    f"Generated {cv_result['word_count']}-word CV (~{cv_result['word_count'] // 400 + 1} pages) "
-                    f"with {cv_result['relevant_skills']} relevant skills highlighted"
-                )
-
-                # Simulate application (would actually apply here)
-                self._log_thought(
-                    f"APPLY-{i}",
-                    f"Would now navigate to application page and fill form with tailored CV"
-                )
-
-                results.append({
-                    'job': job,
-                    'cv_path': str(cv_output_path),
-                    'cv_details': cv_result,
-                    'status': 'cv_generated',
-                    'timestamp': datetime.now().isoformat()
-                })
+            cv_filename = f"cv_tailored_{job['platform']}_{i}_{self.run_ts}.txt"
+            cv_output_paths.append(Path("generated_cvs") / cv_filename)
 
-            except Exception as e:
-                logger.error(f"Error generating CV: {e}")
-                results.append({
-                    'job': job,
-                    'status': 'error',
-                    'error': str(e)
-                })
+        # Generate all CVs concurrently off the event loop, recording (and streaming) each as it finishes
+        Path("generated_cvs").mkdir(parents=True, exist_ok=True)
+        await asyncio.gather(*(
+            self._generate_cv(i, job, cv_output_path, results)
+            for i, (job, cv_output_path) in enumerate(zip(top_jobs, cv_output_paths), 1)
+        ))
 
         return results
 
+    async def _generate_cv(self, i: int, job: Dict, cv_output_path: Path, results: List[Dict]):
+        """Generate one tailored CV in a worker thread and record the outcome as soon as it is known"""
+        try:
+            cv_result = await asyncio.to_thread(
+                self.cv_generator_service.generate_tailored_cv,
+                self.cv_analysis,
+                job,
+                str(cv_output_path)
+            )
+        except Exception as e:
+            logger.error("Error generating CV for job %s: %s", i, e)
+            self._record_result(results, {
+                'job': job,
+                'status': 'error',
+                'error': str(e)
+            })
+            return
+
+        self._log_thought(
+            f"CV-COMPLETE-{i}",
+            f"Generated {cv_result['word_count']}-word CV (~{cv_result['word_count'] // 400 + 1} pages) "
+            f"with {cv_result['relevant_skills']} relevant skills highlighted"
+        )
+
+        # Simulate application (would actually apply here)
+        self._log_thought(
+            f"APPLY-{i}",
+            f"Would now navigate to application page and fill form with tailored CV"
+        )
+
+        self._record_result(results, {
+            'job': job,
+            'cv_path': str(cv_output_path),
+            'cv_details': cv_result,
+            'status': 'cv_generated',
+            'timestamp': datetime.now().isoformat()
+        })
+
     def save_results(self):
         """Save application results and thought log"""
-        output_file = f"application_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        output_file = f"application_results_{self.run_ts}.json"
 
         results_data = {
             'candidate': self.cv_analysis['personal_info'],
             'cv_skills': self.cv_analysis['skills'],
             'search_keywords': self.cv_analysis['keywords'],
-            'thought_process': self.thought_log,
+            'thought_process': {
+                'ts': self._thought_ts,
+                'phase': self._thought_phase,
+                'msg': self._thought_msg,
+            },
             'applications': self.results,
             'timestamp': datetime.now().isoformat()
         }
 
-        with open(output_file, 'w') as f:
-            json.dump(results_data, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps(results_data))
 
-        logger.info(f"\n💾 Results saved to: {output_file}")
+        logger.info("\n💾 Results saved to: %s", output_file)
 
         # Print thought log summary
-        logger.info("\n" + "=" * 80)
+        logger.info("\n%s", SEP)
         logger.info("🧠 THOUGHT PROCESS SUMMARY")
-        logger.info("=" * 80)
-        for thought in self.thought_log:
-            logger.info(thought)
+        logger.info(SEP)
+        for entry in zip(self._thought_ts, self._thought_phase, self._thought_msg):
+            logger.info(self._format_thought(*entry))
 
     async def run(self):
         """Run the complete intelligent job application workflow"""
@@ -427,21 +605,27 @@ class IntelligentJobOperator:
 
             # Step 3: Search jobs
             self._log_thought("STEP 3", "Searching job platforms for relevant positions")
-            all_jobs = []
+            platforms = [JobPlatform.SEEK, JobPlatform.INDEED]
+            search_results = await asyncio.gather(
+                *(self.search_jobs(platform_config, self.cv_analysis['keywords']) for platform_config in platforms),
+                return_exceptions=True
+            )
 
-            for platform_config in [JobPlatform.SEEK, JobPlatform.INDEED]:
-                jobs = await self.search_jobs(platform_config, self.cv_analysis['keywords'])
+            all_jobs = []
+            for platform_config, jobs in zip(platforms, search_results):
+                if isinstance(jobs, Exception):
+                    logger.error("Search on %s failed: %s", platform_config['name'], jobs)
+                    continue
                 all_jobs.extend(jobs)
 
-            logger.info(f"\n✅ Found {len(all_jobs)} total jobs across platforms")
+            logger.info("\n✅ Found %s total jobs across platforms", len(all_jobs))
 
-            # Step 4: Get job details
-            self._log_thought("STEP 4", f"Fetching detailed descriptions for {len(all_jobs)} jobs")
-            detailed_jobs = []
-            for job in all_jobs[:15]:  # Limit to 15 for performance
-                detailed_job = await self.get_job_details(job)
-                if detailed_job['description']:
-                    detailed_jobs.append(detailed_job)
+            # Step 4: Get job details for the most promising jobs only
+            candidates = self.preselect_jobs(all_jobs, limit=15)  # Limit to 15 for performance
+            self._log_thought("STEP 4", f"Fetching detailed descriptions for {len(candidates)} jobs")
+            # At most PAGE_POOL_SIZE of these load at once - each waits for a free pooled page
+            fetched = await asyncio.gather(*map(self.get_job_details, candidates))
+            detailed_jobs = [job for job in fetched if job['description']]
 
             # Step 5: Rank jobs
             self._log_thought("STEP 5", "Ranking jobs by relevance to candidate profile")
@@ -449,27 +633,40 @@ class IntelligentJobOperator:
 
             # Step 6: Apply to top 5
             self._log_thought("STEP 6", "Creating tailored CVs and applying to top 5 jobs")
-            self.results = await self.apply_to_jobs(ranked_jobs)
+            partial_file = Path(f"application_results_{self.run_ts}.jsonl")
+            self._results_writer = asyncio.create_task(self._write_results(partial_file))
+            try:
+                self.results = await self.apply_to_jobs(ranked_jobs)
+            finally:
+                # Flush whatever was produced, even if generation failed part way
+                self._results_queue.put_nowait(None)
+                await self._results_writer
+                self._results_writer = None
+            logger.info("💾 Per-job results streamed to: %s", partial_file)
 
             # Step 7: Save results
             self._log_thought("STEP 7", "Saving application results and thought log")
             self.save_results()
 
-            logger.info("\n" + "=" * 80)
+            logger.info("\n%s", SEP)
             logger.info("✅ WORKFLOW COMPLETE")
-            logger.info("=" * 80)
-            logger.info(f"   • Analyzed CV with {len(self.cv_analysis['skills'])} skills")
-            logger.info(f"   • Searched {len(all_jobs)} jobs across platforms")
-            logger.info(f"   • Ranked {len(detailed_jobs)} jobs by relevance")
-            logger.info(f"   • Generated {len([r for r in self.results if r['status'] == 'cv_generated'])} tailored CVs")
-            logger.info(f"   • Logged {len(self.thought_log)} thought process steps")
-            logger.info("=" * 80)
+            logger.info(SEP)
+            logger.info("   • Analyzed CV with %s skills", len(self.cv_analysis['skills']))
+            logger.info("   • Searched %s jobs across platforms", len(all_jobs))
+            logger.info("   • Ranked %s jobs by relevance", len(detailed_jobs))
+            logger.info("   • Generated %s tailored CVs", len([r for r in self.results if r['status'] == 'cv_generated']))
+            logger.info("   • Logged %s thought process steps", len(self._thought_phase))
+            logger.info(SEP)
 
         except Exception as e:
-            logger.error(f"\n❌ Error in workflow: {e}")
+            logger.error("\n❌ Error in workflow: %s", e)
             raise
 
         finally:
+            while not self._page_pool.empty():
+                await self._page_pool.get_nowait().close()
+            if self.context:
+                await self.context.close()
             if self.browser:
                 await self.browser.close()
             if self.playwright:
@@ -480,9 +677,9 @@ async def main():
     """Entry point"""
     cv_path = "test_cv.txt"  # Default CV path
 
-    logger.info("=" * 80)
+    logger.info(SEP)
     logger.info("🤖 INTELLIGENT JOB APPLICATION OPERATOR")
-    logger.info("=" * 80)
+    logger.info(SEP)
     logger.info("\nThis operator will:")
     logger.info("  1. 📄 Analyze your CV to understand skills and experience")
     logger.info("  2. 🔍 Search job platforms for relevant positions")
@@ -490,7 +687,7 @@ async def main():
     logger.info("  4. 🎯 Pick top 5 most relevant jobs")
     logger.info("  5. ✍️  Create tailored CV for each job (2+ pages)")
     logger.info("  6. 💭 Demonstrate thought process at every step")
-    logger.info("=" * 80)
+    logger.info(SEP)
 
     operator = IntelligentJobOperator(cv_path=cv_path)
 
@@ -15,14 +15,21 @@ Philosophy:
 7. REPEAT - Continue until goal achieved
 """
 import asyncio
+import os
+import re
 import sys
 from pathlib import Path
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 import json
 from dataclasses import dataclass, asdict
 from enum import Enum
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+import queue
 
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
@@ -30,16 +37,192 @@ from playwright.async_api import async_playwright, Page
 import pyautogui
 import pytesseract
 from PIL import Image
-import io
 import cv2
 import numpy as np
 
+from operator_shutdown import wait_for_shutdown
+
+# OCR already runs one Tesseract per worker thread; stop each from also
+# spawning its own OpenMP team. Must be set before libtesseract loads.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+try:
+    from tesserocr import OEM, PyTessBaseAPI
+except ImportError:  # optional - pytesseract is used instead
+    OEM = PyTessBaseAPI = None
+
+try:
+    import easyocr
+except ImportError:  # optional - Tesseract is used instead
+    easyocr = None
+
+try:
+    from mss import mss
+except ImportError:  # optional - screenshots go through Playwright instead
+    mss = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Observations carry OCR text and page metadata; keep only the recent ones
+HISTORY_LIMIT = 50
+
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_PHONE_RE = re.compile(r'\(\d{3}\)\s*\d{3}-\d{4}')
+
+# Tesseract runtime scales with pixel count; OCR a half-size canvas instead
+# of the full 1920x1080 viewport.
+OCR_SIZE = (960, 540)
+
+# Screenshots are OCR'd as horizontal bands in parallel (Tesseract releases the
+# GIL); bands overlap so a line of text cut by one boundary is whole in the other.
+OCR_TILES = 4
+TILE_OVERLAP = 40
+
+# Tesseract page segmentation modes: one uniform text block for whole-screen
+# bands (no orientation/layout analysis), single text line for element crops
+PSM_SINGLE_BLOCK = 6
+PSM_SINGLE_LINE = 7
+
+# LSTM engine only; UI screenshots are dark-on-light and dictionary
+# correction doesn't help with UI labels, so skip inversion and word lists
+TESSERACT_VARIABLES = {
+    "tessedit_do_invert": "0",
+    "load_system_dawg": "0",
+    "load_freq_dawg": "0",
+}
+TESSERACT_CONFIG = "--oem 1 " + " ".join(f"-c {k}={v}" for k, v in TESSERACT_VARIABLES.items())
+
+# Page cues answered straight from the DOM; OCR is only the fallback when
+# none of them match
+DOM_CUES = {
+    "sign_in": 'button:has-text("Sign in"), a:has-text("Sign in"), button:has-text("Log in"), a:has-text("Log in")',
+    "application": 'text=/application/i',
+    "apply": 'button:has-text("Apply"), a:has-text("Apply")',
+    "thank_you": 'text=/thank you|confirmation/i',
+    "email": 'input[type="email"], input[name*="email" i]',
+    "name": 'input[name*="name" i]',
+}
+
+# Where the page viewport sits on the physical display, for OS-level capture,
+# plus what the page believes about the screen and window. Under viewport or
+# scale emulation these disagree with the real display, and the region is not
+# where the page is actually drawn
+VIEWPORT_REGION_JS = """
+() => {
+    const dpr = window.devicePixelRatio;
+    return {
+        left: Math.round((window.screenX + (window.outerWidth - window.innerWidth) / 2) * dpr),
+        top: Math.round((window.screenY + window.outerHeight - window.innerHeight) * dpr),
+        width: Math.round(window.innerWidth * dpr),
+        height: Math.round(window.innerHeight * dpr),
+        screen_width: Math.round(window.screen.width * dpr),
+        screen_height: Math.round(window.screen.height * dpr),
+        fits_window: window.outerWidth >= window.innerWidth && window.outerHeight >= window.innerHeight
+    };
+}
+"""
+
+# Collects the first 10 buttons and inputs with their labels and viewport
+# boxes, plus the title and markup size that identify the page revision,
+# in a single round trip
+DETECT_ELEMENTS_JS = """
+() => {
+    const box = (e) => {
+        const r = e.getBoundingClientRect();
+        return r.width && r.height ? {x: r.x, y: r.y, width: r.width, height: r.height} : null;
+    };
+    const visible = (e) => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+    const buttons = [...document.querySelectorAll(
+        'button, input[type="button"], input[type="submit"], a[role="button"]'
+    )].slice(0, 10).map(e => ({label: visible(e) ? (e.innerText || '').trim() : '', box: box(e)}));
+    const inputs = [...document.querySelectorAll(
+        'input[type="text"], input[type="email"], input[type="tel"], textarea'
+    )].slice(0, 10).map(e => ({
+        label: e.getAttribute('placeholder') || e.getAttribute('name') || '', box: box(e)
+    }));
+    const length = document.body ? document.body.innerHTML.length : 0;
+    return {buttons, inputs, title: document.title, length};
+}
+"""
+
+
+@lru_cache(maxsize=16)
+def _parse_cv(path: str) -> Dict[str, str]:
+    """Read a CV once and pull out the candidate's contact details"""
+    with open(path, 'r') as f:
+        cv_text = f.read()
+
+    return {
+        "name": cv_text.split('\n')[0],
+        "email": m.group(0) if (m := _EMAIL_RE.search(cv_text)) else "",
+        "phone": m.group(0) if (m := _PHONE_RE.search(cv_text)) else "",
+        "cv_path": str(Path(path).absolute())
+    }
+
+
+def _load_gpu_reader() -> Optional["easyocr.Reader"]:
+    """EasyOCR on CUDA, warmed up once; None when there's no GPU to run it on"""
+    if easyocr is None:
+        return None
+    import torch
+    if not torch.cuda.is_available():
+        return None
+    reader = easyocr.Reader(['en'], gpu=True, cudnn_benchmark=True)
+    reader.readtext(np.zeros((OCR_SIZE[1], OCR_SIZE[0]), dtype=np.uint8))
+    return reader
+
+
+def _prepare_for_ocr(screenshot: Union[bytes, np.ndarray]) -> Tuple[np.ndarray, float]:
+    """
+    Decode (JPEG bytes) or convert (raw BGRA frame), downsample and binarize a
+    screenshot; also returns the downsample factor
+    """
+    if isinstance(screenshot, np.ndarray):
+        gray = cv2.cvtColor(screenshot, cv2.COLOR_BGRA2GRAY)
+    else:
+        gray = cv2.imdecode(np.frombuffer(screenshot, np.uint8), cv2.IMREAD_GRAYSCALE)
+    height, width = gray.shape
+    scale = min(OCR_SIZE[0] / width, OCR_SIZE[1] / height, 1.0)
+    if scale < 1.0:
+        gray = cv2.resize(gray, (round(width * scale), round(height * scale)),
+                          interpolation=cv2.INTER_LINEAR)
+    return _binarize(gray), scale
+
+
+def _binarize(gray: np.ndarray) -> np.ndarray:
+    """Adaptive threshold so Tesseract gets high-contrast, 1-channel input"""
+    return cv2.adaptiveThreshold(
+        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10
+    )
+
+
+def _split_bands(image: np.ndarray, count: int, overlap: int) -> List[np.ndarray]:
+    """Split an image into `count` overlapping horizontal bands, top to bottom"""
+    step = -(-image.shape[0] // count)
+    return [image[max(0, y - overlap):y + step + overlap]
+            for y in range(0, image.shape[0], step)]
+
+
+def _clip(image: np.ndarray, box: Dict[str, float], scale: float) -> Optional[Tuple[int, int, int, int]]:
+    """
+    The part of a viewport bounding box (CSS px) that lies on the downsampled
+    image, as (x_min, x_max, y_min, y_max); None for an element scrolled off-screen
+    """
+    height, width = image.shape[:2]
+    x0, x1 = max(0, int(box['x'] * scale)), min(width, int((box['x'] + box['width']) * scale) + 1)
+    y0, y1 = max(0, int(box['y'] * scale)), min(height, int((box['y'] + box['height']) * scale) + 1)
+    return (x0, x1, y0, y1) if x0 < x1 and y0 < y1 else None
+
+
+def _crop(image: np.ndarray, box: Tuple[int, int, int, int]) -> np.ndarray:
+    """Cut a clipped box out of the image"""
+    x0, x1, y0, y1 = box
+    return image[y0:y1, x0:x1]
+
 
 class ThinkingState(Enum):
     """Operator's thought process states"""
@@ -62,6 +245,7 @@ class Observation:
     url: str
     ocr_text: str
     detected_elements: Dict[str, List[str]]
+    dom_cues: Dict[str, bool]
     page_state: str  # "job_listing", "application_form", "login", etc.
 
 
@@ -85,27 +269,44 @@ class LiveConsciousOperator:
         self.goal = goal
         self.cv_path = Path(cv_path)
 
-        # Load CV data
-        with open(cv_path, 'r') as f:
-            cv_text = f.read()
-
-        import re
-        self.candidate_data = {
-            "name": cv_text.split('\n')[0],
-            "email": re.search(r'[\w\.-]+@[\w\.-]+\.\w+', cv_text).group(0) if re.search(r'[\w\.-]+@[\w\.-]+\.\w+', cv_text) else "",
-            "phone": re.search(r'\(\d{3}\)\s*\d{3}-\d{4}', cv_text).group(0) if re.search(r'\(\d{3}\)\s*\d{3}-\d{4}', cv_text) else "",
-            "cv_path": str(self.cv_path.absolute())
-        }
+        # Load CV data (parsed once per path, copied so callers can't alter the cache)
+        self.candidate_data = dict(_parse_cv(str(self.cv_path)))
 
         # Operator state
         self.current_state = ThinkingState.OBSERVING
-        self.observation_history = []
-        self.decision_history = []
-        self.actions_taken = []
+        self.observation_history = deque(maxlen=HISTORY_LIMIT)
+        self.decision_history = deque(maxlen=HISTORY_LIMIT)
+        self.actions_taken = deque(maxlen=HISTORY_LIMIT)
+
+        # Last observation, keyed by a hash of URL + screenshot bytes
+        self._last_screenshot_hash = None
+        self._last_observation = None
+
+        # (url, title, body length) of the last classified page revision and
+        # the cues, OCR text and page state read from it
+        self._last_dom_sig = None
+        self._last_page_read = None
+
+        # OCR engine: batched EasyOCR when a GPU is available, otherwise one
+        # tesserocr API per band keeps the English model loaded for the whole
+        # session instead of spawning a tesseract process per call
+        self.reader = _load_gpu_reader()
+        self.tess_pool = [
+            PyTessBaseAPI(lang='eng', oem=OEM.LSTM_ONLY, variables=TESSERACT_VARIABLES)
+            for _ in range(OCR_TILES)
+        ] if PyTessBaseAPI and not self.reader else []
+        self._idle_apis = queue.SimpleQueue()
+        for api in self.tess_pool:
+            self._idle_apis.put(api)
+        self.ocr_executor = ThreadPoolExecutor(OCR_TILES)
+
+        # Direct display capture; the browser runs headed and maximized
+        self.sct = mss() if mss else None
 
         # Browser
         self.playwright = None
         self.browser = None
+        self.context = None
         self.page = None
 
         # Goal tracking
@@ -129,12 +330,27 @@ class LiveConsciousOperator:
             headless=False,
             args=['--start-maximized']
         )
-        self.page = await self.browser.new_page(
-            viewport={'width': 1920, 'height': 1080}
-        )
+        self.page = await self.fresh_page()
 
         logger.info("✅ Consciousness active - Browser ready")
 
+    async def fresh_page(self) -> Page:
+        """
+        Open a page in a clean BrowserContext on the already-running browser
+        and drop the previous context (cookies, storage, memory)
+        """
+        old_context = self.context
+        self.context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080}
+        )
+        self.page = await self.context.new_page()
+        self._last_screenshot_hash = None
+        self._last_dom_sig = None
+        self._last_page_read = None
+        if old_context:
+            await old_context.close()
+        return self.page
+
     async def observe_environment(self) -> Observation:
         """
         OBSERVE - Actually look at the screen and understand what's there
@@ -145,26 +361,33 @@ class LiveConsciousOperator:
         logger.info("-" * 80)
 
         # Capture screenshot
-        screenshot_bytes = await self.page.screenshot()
-        screenshot_base64 = Image.open(io.BytesIO(screenshot_bytes))
-
-        # Get page metadata
-        title = await self.page.title()
+        screenshot = await self._capture_screen()
         url = self.page.url
 
-        # OCR - Read actual text from pixels
-        try:
-            ocr_text = pytesseract.image_to_string(screenshot_base64)
-            logger.info(f"📖 Reading page text via OCR ({len(ocr_text)} chars)")
-        except Exception as e:
-            logger.warning(f"⚠️  OCR failed: {e}")
-            ocr_text = ""
+        # Nothing moved on screen since last time - skip OCR and classification
+        frame = screenshot if isinstance(screenshot, bytes) else screenshot.tobytes()
+        screenshot_hash = hash((url, frame))
+        if screenshot_hash == self._last_screenshot_hash:
+            logger.info("♻️  Screen unchanged - reusing last observation")
+            return self._last_observation
+
+        detected_elements, regions, page_info = await self._detect_visual_elements()
+        title = page_info["title"] if page_info else await self.page.title()
+        dom_sig = (url, title, page_info["length"]) if page_info else None
+
+        if dom_sig and dom_sig == self._last_dom_sig:
+            # Same page revision (e.g. only scrolled) - its cues and state still hold
+            dom_cues, ocr_text, page_state = self._last_page_read
+        else:
+            dom_cues = await self._detect_dom_cues()
 
-        # Detect visual elements
-        detected_elements = await self._detect_visual_elements()
+            # OCR only when the DOM gave no clue what this page is
+            ocr_text = "" if any(dom_cues.values()) else await self._read_text(screenshot, regions)
 
-        # Understand page state
-        page_state = self._classify_page_state(title, url, ocr_text, detected_elements)
+            # Understand page state
+            page_state = self._classify_page_state(title, url, ocr_text, dom_cues)
+            self._last_dom_sig = dom_sig
+            self._last_page_read = (dom_cues, ocr_text, page_state)
 
         observation = Observation(
             timestamp=datetime.now().isoformat(),
@@ -173,10 +396,13 @@ class LiveConsciousOperator:
             url=url,
             ocr_text=ocr_text,
             detected_elements=detected_elements,
+            dom_cues=dom_cues,
             page_state=page_state
         )
 
         self.observation_history.append(observation)
+        self._last_screenshot_hash = screenshot_hash
+        self._last_observation = observation
 
         # Log what we see
         logger.info(f"📄 Title: {title}")
@@ -187,51 +413,151 @@ class LiveConsciousOperator:
 
         return observation
 
-    async def _detect_visual_elements(self) -> Dict[str, List[str]]:
-        """Detect interactive elements using multiple methods"""
+    async def _detect_dom_cues(self) -> Dict[str, bool]:
+        """Check the DOM for each page cue concurrently"""
+        async def present(selector: str) -> bool:
+            try:
+                return await self.page.locator(selector).count() > 0
+            except Exception:
+                return False
+
+        found = await asyncio.gather(*map(present, DOM_CUES.values()))
+        return dict(zip(DOM_CUES, found))
+
+    async def _capture_screen(self) -> Union[bytes, np.ndarray]:
+        """
+        Grab the viewport straight off the display with mss (raw BGRA, no
+        encoding); fall back to a Playwright JPEG, which decodes far faster
+        than PNG and is plenty for OCR
+        """
+        if self.sct:
+            try:
+                region = await self.page.evaluate(VIEWPORT_REGION_JS)
+                if self._region_on_screen(region):
+                    box = {key: region[key] for key in ('left', 'top', 'width', 'height')}
+                    frame = np.asarray(self.sct.grab(box))
+                    if frame.shape[:2] == (box['height'], box['width']):
+                        return frame
+                    logger.debug(f"Screen grab is {frame.shape[1]}x{frame.shape[0]}, "
+                                 f"viewport is {box['width']}x{box['height']} - using browser screenshot")
+            except Exception as e:
+                logger.warning(f"⚠️  Screen grab failed, using browser screenshot: {e}")
+        return await self.page.screenshot(type='jpeg', quality=85)
+
+    def _region_on_screen(self, region: Dict) -> bool:
+        """
+        Whether the viewport region is really where the page is drawn: the
+        window holds the whole viewport, the page's screen size at its pixel
+        ratio is a physical monitor (no emulated viewport or scale), and the
+        region lies inside the display
+        """
+        if not region['fits_window']:
+            return False
+        monitors = self.sct.monitors
+        if not any((m['width'], m['height']) == (region['screen_width'], region['screen_height'])
+                   for m in monitors[1:]):
+            return False
+        display = monitors[0]
+        return (region['left'] >= display['left'] and region['top'] >= display['top']
+                and region['left'] + region['width'] <= display['left'] + display['width']
+                and region['top'] + region['height'] <= display['top'] + display['height'])
+
+    async def _read_text(self, screenshot: Union[bytes, np.ndarray], regions: List[Dict[str, float]]) -> str:
+        """OCR - Read actual text from pixels, off the event loop"""
+        try:
+            ocr_text = await asyncio.to_thread(self._ocr, screenshot, regions)
+            logger.info(f"📖 Reading page text via OCR ({len(ocr_text)} chars)")
+        except Exception as e:
+            logger.warning(f"⚠️  OCR failed: {e}")
+            ocr_text = ""
+        return ocr_text
+
+    def _ocr(self, screenshot: Union[bytes, np.ndarray], regions: List[Dict[str, float]]) -> str:
+        """
+        Read text from the element regions as single lines, or from the whole
+        screen in bands if the DOM gave us nothing to aim at
+        """
+        image, scale = _prepare_for_ocr(screenshot)
+        if self.reader:
+            return self._gpu_ocr(image, scale, regions)
+        boxes = [box for box in (_clip(image, region, scale) for region in regions) if box]
+        tiles = [_crop(image, box) for box in boxes]
+        psm = PSM_SINGLE_LINE
+        if not tiles:
+            tiles = _split_bands(image, OCR_TILES, TILE_OVERLAP)
+            psm = PSM_SINGLE_BLOCK
+        return "\n".join(self.ocr_executor.map(self._read_tile, tiles, repeat(psm)))
+
+    def _gpu_ocr(self, image: np.ndarray, scale: float, regions: List[Dict[str, float]]) -> str:
+        """Recognize all element regions in one EasyOCR batch, or detect + read the whole screen"""
+        boxes = [list(box) for box in (_clip(image, region, scale) for region in regions) if box]
+        if boxes:
+            texts = self.reader.recognize(image, horizontal_list=boxes, free_list=[],
+                                          batch_size=len(boxes), detail=0)
+        else:
+            texts = self.reader.readtext(image, detail=0)
+        return "\n".join(texts)
+
+    def _read_tile(self, tile: np.ndarray, psm: int) -> str:
+        if not self.tess_pool:
+            return pytesseract.image_to_string(tile, config=f'{TESSERACT_CONFIG} --psm {psm}')
+        api = self._idle_apis.get()
+        try:
+            api.SetPageSegMode(psm)
+            api.SetImage(Image.fromarray(tile))
+            return api.GetUTF8Text()
+        finally:
+            self._idle_apis.put(api)
+
+    async def _detect_visual_elements(self) -> Tuple[Dict[str, List[str]], List[Dict[str, float]], Optional[Dict[str, Any]]]:
+        """
+        Detect interactive elements using multiple methods, plus their on-screen
+        boxes and the page's title/markup length (None if the DOM read failed)
+        """
         elements = {
             "buttons": [],
             "inputs": [],
             "links": [],
             "forms": []
         }
+        regions = []
+        page_info = None
 
-        # Method 1: DOM detection
+        # Method 1: DOM detection, all in one evaluate round trip
         try:
-            buttons = await self.page.query_selector_all('button, input[type="button"], input[type="submit"], a[role="button"]')
-            for btn in buttons[:10]:  # Limit to avoid spam
-                text = await btn.inner_text() if await btn.is_visible() else ""
-                if text:
-                    elements["buttons"].append(text.strip())
-
-            inputs = await self.page.query_selector_all('input[type="text"], input[type="email"], input[type="tel"], textarea')
-            for inp in inputs[:10]:
-                placeholder = await inp.get_attribute('placeholder')
-                name = await inp.get_attribute('name')
-                if placeholder or name:
-                    elements["inputs"].append(placeholder or name or "unnamed")
+            found = await self.page.evaluate(DETECT_ELEMENTS_JS)
+            for kind in ("buttons", "inputs"):
+                for item in found[kind]:
+                    if item["label"]:
+                        elements[kind].append(item["label"])
+                        if item["box"]:
+                            regions.append(item["box"])
+            page_info = {"title": found["title"], "length": found["length"]}
 
         except Exception as e:
             logger.warning(f"Element detection error: {e}")
 
-        return elements
+        return elements, regions, page_info
 
-    def _classify_page_state(self, title: str, url: str, ocr_text: str, elements: Dict) -> str:
+    def _classify_page_state(self, title: str, url: str, ocr_text: str, dom_cues: Dict[str, bool]) -> str:
         """Understand what kind of page we're on"""
         title_lower = title.lower()
         url_lower = url.lower()
         ocr_lower = ocr_text.lower()
 
+        def seen(cue: str, *words: str) -> bool:
+            return dom_cues.get(cue) or any(word in ocr_lower for word in words)
+
         # Check for different page types
-        if "sign in" in ocr_lower or "log in" in ocr_lower or "login" in url_lower:
+        if seen("sign_in", "sign in", "log in") or "login" in url_lower:
             return "LOGIN_PAGE"
-        elif "application" in ocr_lower or "apply" in title_lower:
+        elif seen("application", "application") or "apply" in title_lower:
             return "APPLICATION_FORM"
         elif "job" in url_lower and any(word in title_lower for word in ["developer", "engineer", "programmer"]):
             return "JOB_DETAILS"
         elif "search" in url_lower or "jobs" in url_lower:
             return "JOB_LISTINGS"
-        elif "thank you" in ocr_lower or "confirmation" in ocr_lower:
+        elif seen("thank_you", "thank you", "confirmation"):
             return "CONFIRMATION"
         else:
             return "UNKNOWN"
@@ -265,7 +591,9 @@ class LiveConsciousOperator:
 
             # Check if we see an Apply button
             apply_words = ["apply", "submit application", "quick apply"]
-            has_apply = any(word in observation.ocr_text.lower() for word in apply_words)
+            has_apply = observation.dom_cues.get("apply") or any(
+                word in observation.ocr_text.lower() for word in apply_words
+            )
 
             if has_apply:
                 logger.info("💭 Decision: I see an Apply button - clicking it")
@@ -291,7 +619,7 @@ class LiveConsciousOperator:
             logger.info("💭 Decision: I should fill in my details")
 
             # Intelligent form filling based on what we detect
-            if "email" in observation.ocr_text.lower():
+            if observation.dom_cues.get("email") or "email" in observation.ocr_text.lower():
                 decision = Decision(
                     action_type="type",
                     target='input[type="email"], input[name*="email" i]',
@@ -299,7 +627,7 @@ class LiveConsciousOperator:
                     reasoning="Detected email field that needs filling",
                     confidence=0.9
                 )
-            elif "name" in observation.ocr_text.lower():
+            elif observation.dom_cues.get("name") or "name" in observation.ocr_text.lower():
                 decision = Decision(
                     action_type="type",
                     target='input[name*="name" i]:not([name*="last" i])',
@@ -473,11 +801,11 @@ class LiveConsciousOperator:
                 await asyncio.sleep(2)
                 continue
 
-            # Wait for page to settle
+            # OBSERVE AGAIN - execute_action already paused for the page to
+            # settle, so capture + OCR run during the rest of the settle time
+            observation_task = asyncio.create_task(self.observe_environment())
             await asyncio.sleep(2)
-
-            # OBSERVE AGAIN
-            observation_after = await self.observe_environment()
+            observation_after = await observation_task
 
             # VERIFY
             verified = await self.verify_action_result(observation_before, observation_after)
@@ -510,7 +838,7 @@ class LiveConsciousOperator:
         # Keep browser open for review
         logger.info("\n💡 Browser staying open for your review...")
         logger.info("   Press Ctrl+C to close")
-        await asyncio.sleep(3600)
+        await wait_for_shutdown()
 
 
 async def main():
@@ -527,6 +855,11 @@ async def main():
     except KeyboardInterrupt:
         logger.info("\n\n👋 Operator consciousness suspended")
     finally:
+        operator.ocr_executor.shutdown()
+        for api in operator.tess_pool:
+            api.End()
+        if operator.sct:
+            operator.sct.close()
         if operator.browser:
             await operator.browser.close()
         if operator.playwright:
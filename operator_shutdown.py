@@ -0,0 +1,22 @@
+"""
+Ctrl+C handling shared by the operator scripts that keep the browser open for review
+"""
+import asyncio
+import signal
+
+
+async def wait_for_shutdown():
+    """Block until Ctrl+C, then return so the browser can be closed right away"""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+    except NotImplementedError:
+        # Windows event loops have no signal handlers - Ctrl+C cancels the wait instead
+        await stop.wait()
+        return
+
+    try:
+        await stop.wait()
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
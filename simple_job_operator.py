@@ -5,40 +5,93 @@ No Phase 1 dependencies required
 """
 import asyncio
 from pathlib import Path
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, Page, Route, TimeoutError as PlaywrightTimeoutError
 from typing import List, Dict, Any
 import logging
 
+from operator_shutdown import wait_for_shutdown
+
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# Cookies/local storage saved at the end of a run and restored by the next one,
+# so Seek's consent and session warm-up isn't repeated every time
+STATE_FILE = Path(".seek_state.json")
+
+# Job cards read from the search results
+JOB_LIMIT = 5
+
+# Job tabs kept open - each is a renderer process, so this bounds Chromium memory.
+# Beyond this, a job reuses the tab of one that has already loaded
+MAX_TABS = 4
+
+# Job card selectors, best first (Seek's data attributes, then generic fallbacks)
+JOB_CARD_SELECTORS = ['[data-card-type="JobCard"]', 'article[data-testid*="job"]', 'article']
+JOB_CARD_UNION = ", ".join(JOB_CARD_SELECTORS)
+
+# Not needed to read job cards - blocked on the search page when block_assets is set
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+TRACKER_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net",
+                 "facebook.net", "hotjar.com", "bat.bing.com")
+
+# Given every element matching JOB_CARD_UNION, keeps the cards of the first
+# selector that matched and reads every field of the first `limit` of them
+EXTRACT_JOBS_JS = """
+(elements, {selectors, limit}) => {
+    const readCard = (card) => {
+        const text = (selector, fallback) => {
+            const el = card.querySelector(selector);
+            return el ? el.innerText.trim() : fallback;
+        };
+        const link = card.querySelector('a[href]');
+        return {
+            title: text('[data-testid*="job-title"], h3 a, a', 'Unknown'),
+            company: text('[data-testid*="company"], span[data-testid*="company"]', 'Unknown Company'),
+            location: text('[data-testid*="location"], span[data-testid*="location"]', 'Unknown'),
+            href: link ? link.getAttribute('href') : null,
+            description: text('[data-testid*="snippet"], p', '')
+        };
+    };
+    for (const selector of selectors) {
+        const cards = elements.filter(el => el.matches(selector));
+        if (cards.length) {
+            return {total: cards.length, jobs: cards.slice(0, limit).map(readCard)};
+        }
+    }
+    return {total: 0, jobs: []};
+}
+"""
+
 
 class SimpleJobOperator:
     """Simple job search operator using Playwright"""
 
-    def __init__(self, cv_path: str):
+    def __init__(self, cv_path: str, block_assets: bool = True):
         self.cv_path = Path(cv_path)
+        self.block_assets = block_assets
         self.playwright = None
         self.browser = None
         self.context = None
         self.pages = []
         self.found_jobs = []
 
+        # Job tabs, reused once loaded when more jobs than tabs are found
+        self.max_tabs = MAX_TABS
+        self.tab_pool: List[Page] = []
+        self._tab_slots = 0
+        self._idle_tabs: asyncio.Queue = asyncio.Queue()
+
     async def initialize(self):
         """Initialize browser"""
         logger.info("=" * 60)
         logger.info("🤖 AUTONOMOUS JOB SEARCH OPERATOR")
         logger.info("=" * 60)
 
-        # Load CV
+        # Load CV - only the header (name, role) is used, so read just that
         logger.info(f"\n📄 Loading CV: {self.cv_path.name}")
         with open(self.cv_path, 'r', encoding='utf-8') as f:
-            cv_text = f.read()
-
-        # Extract basic info from CV
-        lines = cv_text.split('\n')
-        name = lines[0] if lines else "Candidate"
-        role = lines[1] if len(lines) > 1 else "Professional"
+            name = f.readline().strip() or "Candidate"
+            role = f.readline().strip() or "Professional"
 
         logger.info(f"👤 Candidate: {name}")
         logger.info(f"💼 Role: {role}")
@@ -50,11 +103,14 @@ class SimpleJobOperator:
             headless=False,
             args=['--start-maximized']
         )
-        self.context = await self.browser.new_context(
+        context_options = dict(
             viewport={'width': 1920, 'height': 1080},
             locale='en-AU',
             timezone_id='Australia/Melbourne'
         )
+        if STATE_FILE.exists():
+            context_options['storage_state'] = str(STATE_FILE)
+        self.context = await self.browser.new_context(**context_options)
 
         logger.info("✅ Browser ready")
 
@@ -65,9 +121,11 @@ class SimpleJobOperator:
         logger.info(f"📍 LOCATION: {location}")
         logger.info("=" * 60)
 
-        # Create search page
+        # Create search page (job tabs stay unfiltered for review)
         page = await self.context.new_page()
         self.pages.append(page)
+        if self.block_assets:
+            await page.route("**/*", self._block_assets)
 
         # Build URL
         keywords_clean = keywords.replace(' ', '-').lower()
@@ -79,88 +137,68 @@ class SimpleJobOperator:
         logger.info("⏳ Loading job listings...")
 
         try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(3)
+            # Trackers keep a SERP from ever going network-idle; wait for the
+            # job cards themselves instead
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            try:
+                await page.wait_for_selector(JOB_CARD_UNION, timeout=10000)
+            except PlaywrightTimeoutError:
+                logger.warning("⚠️  No job cards appeared within 10s")
 
             logger.info("\n📋 Extracting jobs...")
 
-            # Try to find job cards
-            # Seek uses data-testid attributes
-            job_cards = await page.query_selector_all('[data-card-type="JobCard"]')
-
-            if not job_cards:
-                # Fallback selectors
-                job_cards = await page.query_selector_all('article[data-testid*="job"]')
+            # Extract the first JOB_LIMIT job cards in one call, without element handles
+            listings = await page.locator(JOB_CARD_UNION).evaluate_all(
+                EXTRACT_JOBS_JS, {"selectors": JOB_CARD_SELECTORS, "limit": JOB_LIMIT}
+            )
 
-            if not job_cards:
-                # Try generic article tags
-                job_cards = await page.query_selector_all('article')
+            logger.info(f"✅ Found {listings['total']} job listings\n")
 
-            logger.info(f"✅ Found {len(job_cards)} job listings\n")
-
-            # Extract first 5 jobs
-            for i, card in enumerate(job_cards[:5], 1):
-                try:
-                    job = await self._extract_job(card, i)
-                    if job:
-                        self.found_jobs.append(job)
-
-                except Exception as e:
-                    logger.error(f"❌ Error extracting job {i}: {e}")
+            for i, data in enumerate(listings["jobs"], 1):
+                self.found_jobs.append(self._extract_job(data, i))
 
         except Exception as e:
             logger.error(f"❌ Search failed: {e}")
 
-    async def _extract_job(self, card, index: int) -> Dict[str, Any]:
-        """Extract job details from card"""
-        try:
-            # Title
-            title_elem = await card.query_selector('[data-testid*="job-title"], h3 a, a')
-            title_text = await title_elem.inner_text() if title_elem else "Unknown"
-            title = title_text.strip()
-
-            # Company
-            company_elem = await card.query_selector('[data-testid*="company"], span[data-testid*="company"]')
-            company_text = await company_elem.inner_text() if company_elem else "Unknown Company"
-            company = company_text.strip()
-
-            # Location
-            location_elem = await card.query_selector('[data-testid*="location"], span[data-testid*="location"]')
-            location_text = await location_elem.inner_text() if location_elem else "Unknown"
-            location = location_text.strip()
-
-            # URL
-            link = await card.query_selector('a[href]')
-            href = await link.get_attribute('href') if link else None
-            url = f"https://www.seek.com.au{href}" if href and not href.startswith('http') else href
-
-            # Description snippet
-            desc_elem = await card.query_selector('[data-testid*="snippet"], p')
-            desc_text = await desc_elem.inner_text() if desc_elem else ""
-            description = desc_text.strip()
-
-            # Print job info
-            logger.info(f"📌 JOB {index}:")
-            logger.info(f"   📋 {title}")
-            logger.info(f"   🏢 {company}")
-            logger.info(f"   📍 {location}")
-            if description:
-                preview = description[:80] + "..." if len(description) > 80 else description
-                logger.info(f"   💬 {preview}")
-            logger.info("")
-
-            return {
-                "index": index,
-                "title": title,
-                "company": company,
-                "location": location,
-                "url": url,
-                "description": description
-            }
-
-        except Exception as e:
-            logger.error(f"Error in _extract_job: {e}")
-            return None
+    def _extract_job(self, data: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Build a job record from the fields read off its card"""
+        title = data["title"]
+        company = data["company"]
+        location = data["location"]
+        description = data["description"]
+
+        # URL
+        href = data["href"]
+        url = f"https://www.seek.com.au{href}" if href and not href.startswith('http') else href
+
+        # Print job info
+        logger.info(f"📌 JOB {index}:")
+        logger.info(f"   📋 {title}")
+        logger.info(f"   🏢 {company}")
+        logger.info(f"   📍 {location}")
+        if description:
+            preview = description[:80] + "..." if len(description) > 80 else description
+            logger.info(f"   💬 {preview}")
+        logger.info("")
+
+        return {
+            "index": index,
+            "title": title,
+            "company": company,
+            "location": location,
+            "url": url,
+            "description": description
+        }
+
+    @staticmethod
+    async def _block_assets(route: Route):
+        """Abort images, fonts, media, stylesheets and tracker requests"""
+        request = route.request
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                or any(host in request.url for host in TRACKER_HOSTS)):
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def open_job_tabs(self):
         """Open each job in a new tab"""
@@ -168,28 +206,60 @@ class SimpleJobOperator:
         logger.info("📑 OPENING JOB TABS")
         logger.info("=" * 60)
 
-        opened = 0
-        for job in self.found_jobs:
-            if not job.get('url'):
-                continue
+        # Open all jobs concurrently; the tab pool limits how many load at once
+        jobs = [job for job in self.found_jobs if job.get('url')]
+        results = await asyncio.gather(*[self._open_job_tab(job) for job in jobs])
+
+        # A loaded job loses its tab when a later one reuses it (more jobs than max_tabs)
+        displaced = [job for job, ok in zip(jobs, results) if ok and job.get('page') is None]
+        for job in displaced:
+            logger.warning(f"⚠️  Tab reused by a later job, no longer open: {job['title']}")
+        opened = sum(results) - len(displaced)
+
+        logger.info(f"\n✅ Successfully opened {opened}/{len(self.found_jobs)} job tabs")
 
+    async def _acquire_tab(self) -> Page:
+        """Get a new tab while under max_tabs, otherwise wait for a loaded one"""
+        if self._tab_slots < self.max_tabs:
+            self._tab_slots += 1  # reserve the slot before awaiting
             try:
-                logger.info(f"\n🌐 Opening: {job['title']}")
+                page = await self.context.new_page()
+            except Exception:
+                self._tab_slots -= 1
+                raise
+            self.tab_pool.append(page)
+            self.pages.append(page)
+            return page
+
+        page = await self._idle_tabs.get()
+        for job in self.found_jobs:
+            if job.get('page') is page:
+                job['page'] = None
+        return page
 
-                # Open in new tab
-                new_page = await self.context.new_page()
-                self.pages.append(new_page)
+    async def _open_job_tab(self, job: Dict[str, Any]) -> bool:
+        """Open one job in a pooled tab"""
+        try:
+            logger.info(f"\n🌐 Opening: {job['title']}")
+            page = await self._acquire_tab()
+        except Exception as e:
+            logger.error(f"   ❌ Failed: {job['title']}: {e}")
+            return False
 
-                await new_page.goto(job['url'], wait_until="domcontentloaded", timeout=15000)
-                await asyncio.sleep(1.5)
+        try:
+            await page.goto(job['url'], wait_until="domcontentloaded", timeout=15000)
+            job['page'] = page
 
-                logger.info(f"   ✅ Opened in tab {opened + 2}")  # +2 because tab 1 is search results
-                opened += 1
+            tab = self.pages.index(page) + 1
+            logger.info(f"   ✅ Opened in tab {tab}: {job['title']}")
+            return True
 
-            except Exception as e:
-                logger.error(f"   ❌ Failed: {e}")
+        except Exception as e:
+            logger.error(f"   ❌ Failed: {job['title']}: {e}")
+            return False
 
-        logger.info(f"\n✅ Successfully opened {opened}/{len(self.found_jobs)} job tabs")
+        finally:
+            self._idle_tabs.put_nowait(page)
 
     async def run(self, keywords: str = "Full Stack Developer", location: str = "Melbourne VIC"):
         """Run complete workflow"""
@@ -211,12 +281,13 @@ class SimpleJobOperator:
             logger.info("📊 SUMMARY")
             logger.info("=" * 60)
             logger.info(f"Jobs found: {len(self.found_jobs)}")
-            logger.info(f"Tabs open: {len(self.pages)}")
+            logger.info(f"Job tabs open: {len(self.tab_pool)}")
             logger.info(f"\n💡 Browser will stay open for review")
             logger.info("   Press Ctrl+C when done")
 
-            # Keep open
-            await asyncio.sleep(3600)
+            # Keep open until Ctrl+C
+            await wait_for_shutdown()
+            logger.info("\n\n👋 Closing browser...")
 
         except KeyboardInterrupt:
             logger.info("\n\n👋 Closing browser...")
@@ -225,6 +296,11 @@ class SimpleJobOperator:
             import traceback
             traceback.print_exc()
         finally:
+            if self.context:
+                try:
+                    await self.context.storage_state(path=str(STATE_FILE))
+                except Exception as e:
+                    logger.warning(f"⚠️  Could not save browser state: {e}")
             if self.browser:
                 await self.browser.close()
             if self.playwright:
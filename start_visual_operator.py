@@ -4,433 +4,153 @@ Start Visual Desktop Operator in development mode
 Local development server without Docker dependencies
 """
 
+import atexit
 import os
+import re
+import shutil
+import signal
 import sys
 import subprocess
-import time
 import threading
+import time
 import webbrowser
+from functools import cache, lru_cache
 from pathlib import Path
 
+# Frontend dev server command - npm, else yarn - resolved from PATH once
+if npm := shutil.which("npm"):
+    _NODE_CMD = [npm, "run", "dev"]
+elif yarn := shutil.which("yarn"):
+    _NODE_CMD = [yarn, "dev"]
+else:
+    _NODE_CMD = None
+
+# Running server processes by name - a starter called again reuses a live one
+_CHILDREN = {}
+
+def _spawn(cmd, cwd):
+    """Popen that skips closing inherited fds on POSIX - nothing sensitive is open here"""
+    return subprocess.Popen(cmd, cwd=str(cwd), close_fds=os.name == 'nt')
+
+def _running(name):
+    """The live process registered under `name`, if any"""
+    process = _CHILDREN.get(name)
+    return process if process and process.poll() is None else None
+
+@lru_cache(maxsize=4)
+def _resolve_backend_command(backend_dir):
+    """uvicorn command prefix for the backend's venv, or the system Python"""
+    venv_path = Path(backend_dir) / "venv"
+    if venv_path.exists():
+        scripts = venv_path / ("Scripts" if os.name == 'nt' else "bin")
+        suffix = ".exe" if os.name == 'nt' else ""
+        uvicorn_exe = scripts / f"uvicorn{suffix}"
+        python_exe = scripts / f"python{suffix}"
+
+        if os.access(uvicorn_exe, os.X_OK):
+            return (str(uvicorn_exe),)
+        if os.access(python_exe, os.X_OK):
+            return (str(python_exe), "-m", "uvicorn")
+
+    # Use system Python
+    return (sys.executable, "-m", "uvicorn")
+
 def start_backend():
-    """Start FastAPI backend server"""
-    print("🚀 Starting backend server...")
+    """Start FastAPI backend server without waiting for it; returns its process"""
+    if _running("backend"):
+        return _CHILDREN["backend"]
+
     backend_dir = Path(__file__).parent / "backend"
-    
-    # Check if virtual environment exists
-    venv_path = backend_dir / "venv"
-    if venv_path.exists():
-        if os.name == 'nt':  # Windows
-            python_exe = venv_path / "Scripts" / "python.exe"
-            uvicorn_exe = venv_path / "Scripts" / "uvicorn.exe"
-        else:  # Linux/macOS
-            python_exe = venv_path / "bin" / "python"
-            uvicorn_exe = venv_path / "bin" / "uvicorn"
-        
-        if uvicorn_exe.exists():
-            subprocess.run([str(uvicorn_exe), "main:app", "--reload", "--port", "8001"], cwd=str(backend_dir))
-        else:
-            subprocess.run([str(python_exe), "-m", "uvicorn", "main:app", "--reload", "--port", "8001"], cwd=str(backend_dir))
-    else:
-        # Use system Python
-        subprocess.run([sys.executable, "-m", "uvicorn", "main:app", "--reload", "--port", "8001"], cwd=str(backend_dir))
+    if not backend_dir.exists():
+        print("⚠️  No backend directory - skipping backend server")
+        return None
+
+    print("🚀 Starting backend server...")
+    cmd = [*_resolve_backend_command(str(backend_dir)), "main:app", "--reload", "--port", "8001"]
+
+    _CHILDREN["backend"] = _spawn(cmd, backend_dir)
+    return _CHILDREN["backend"]
 
 def start_frontend():
-    """Start Next.js frontend server"""
-    print("🌐 Starting frontend server...")
+    """Start Next.js frontend server without waiting for it; returns its process"""
+    if _running("frontend"):
+        return _CHILDREN["frontend"]
+
     frontend_dir = Path(__file__).parent / "frontend"
-    
-    # Try npm first, then yarn
-    try:
-        subprocess.run(["npm", "run", "dev"], cwd=str(frontend_dir), check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not frontend_dir.exists():
+        print("⚠️  No frontend directory - skipping frontend server")
+        return None
+
+    if _NODE_CMD is None:
+        print("❌ Neither npm nor yarn found. Please install Node.js")
+        return None
+
+    print("🌐 Starting frontend server...")
+    _CHILDREN["frontend"] = _spawn(_NODE_CMD, frontend_dir)
+    return _CHILDREN["frontend"]
+
+@atexit.register
+def stop_servers():
+    """Terminate the started servers, killing any that don't exit within 5s"""
+    processes = list(_CHILDREN.values())
+    _CHILDREN.clear()
+    for process in processes:
+        process.terminate()
+    for process in processes:
         try:
-            subprocess.run(["yarn", "dev"], cwd=str(frontend_dir), check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("❌ Neither npm nor yarn found. Please install Node.js")
-            return
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+# Simple demo page that simulates the virtual desktop
+DEMO_TEMPLATE = Path(__file__).parent / "templates" / "visual_operator_demo.html"
+MINIFY_DEMO = True  # the template stays readable; the written page is compacted
+
+def _minify(html):
+    """Drop indentation, blank lines, HTML comments and spaces after CSS colons"""
+    html = re.sub(rb"<!--.*?-->", b"", html, flags=re.S)
+    html = re.sub(rb"\n\s+", b"\n", html)
+    return re.sub(rb"<style>.*?</style>", lambda m: re.sub(rb":\s+", b":", m.group()), html, flags=re.S)
+
+@lru_cache(maxsize=1)
+def _demo_html():
+    """The demo page, read from its template on first use"""
+    html = DEMO_TEMPLATE.read_bytes()
+    return _minify(html) if MINIFY_DEMO else html
 
 def create_demo_session():
     """Create a demo virtual desktop session"""
     print("🖥️  Creating demo virtual desktop session...")
     
-    # Create a simple demo HTML page that simulates the virtual desktop
-    demo_html = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Visual Desktop Operator - Demo</title>
-    <style>
-        body {
-            margin: 0;
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            overflow: hidden;
-        }
-        
-        .container {
-            display: flex;
-            height: 100vh;
-        }
-        
-        .sidebar {
-            width: 300px;
-            background: rgba(0, 0, 0, 0.2);
-            backdrop-filter: blur(10px);
-            padding: 20px;
-            box-shadow: 2px 0 20px rgba(0, 0, 0, 0.1);
-        }
-        
-        .desktop-area {
-            flex: 1;
-            position: relative;
-            background: #1e1e1e;
-            border-radius: 10px 0 0 0;
-            margin: 10px 10px 10px 0;
-            overflow: hidden;
-        }
-        
-        .desktop-header {
-            background: #2d2d2d;
-            padding: 15px;
-            border-bottom: 1px solid #444;
-            display: flex;
-            justify-content: between;
-            align-items: center;
-        }
-        
-        .desktop-content {
-            height: calc(100vh - 80px);
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100" viewBox="0 0 100 100"><rect width="100" height="100" fill="%23121212"/><circle cx="50" cy="50" r="2" fill="%23333"/></svg>') repeat;
-            position: relative;
-        }
-        
-        .command-input {
-            width: 100%;
-            background: rgba(255, 255, 255, 0.1);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            border-radius: 8px;
-            padding: 12px;
-            color: white;
-            margin-bottom: 20px;
-        }
-        
-        .command-input::placeholder {
-            color: rgba(255, 255, 255, 0.6);
-        }
-        
-        .status-panel {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 20px;
-        }
-        
-        .status-item {
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 10px;
-        }
-        
-        .virtual-window {
-            position: absolute;
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-            min-width: 300px;
-            min-height: 200px;
-        }
-        
-        .window-header {
-            background: #f0f0f0;
-            padding: 10px 15px;
-            border-radius: 8px 8px 0 0;
-            border-bottom: 1px solid #ddd;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .window-content {
-            padding: 20px;
-            color: #333;
-        }
-        
-        .browser-window {
-            top: 50px;
-            left: 50px;
-            width: 600px;
-            height: 400px;
-        }
-        
-        .terminal-window {
-            top: 100px;
-            left: 200px;
-            width: 500px;
-            height: 300px;
-            background: #1e1e1e;
-            color: #00ff00;
-        }
-        
-        .terminal-window .window-header {
-            background: #333;
-            color: white;
-        }
-        
-        .terminal-content {
-            padding: 15px;
-            font-family: 'Courier New', monospace;
-            background: #1e1e1e;
-            height: calc(100% - 50px);
-            overflow-y: auto;
-        }
-        
-        .taskbar {
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            right: 0;
-            height: 50px;
-            background: rgba(0, 0, 0, 0.8);
-            backdrop-filter: blur(10px);
-            display: flex;
-            align-items: center;
-            padding: 0 20px;
-        }
-        
-        .taskbar-item {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 6px;
-            padding: 8px 15px;
-            margin-right: 10px;
-            font-size: 14px;
-        }
-        
-        .pulse {
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0% { opacity: 0.6; }
-            50% { opacity: 1; }
-            100% { opacity: 0.6; }
-        }
-        
-        .demo-badge {
-            position: absolute;
-            top: 20px;
-            right: 20px;
-            background: rgba(255, 0, 0, 0.8);
-            padding: 5px 12px;
-            border-radius: 15px;
-            font-size: 12px;
-            font-weight: bold;
-        }
-    </style>
-</head>
-<body>
-    <div class="demo-badge">DEMO MODE</div>
-    <div class="container">
-        <div class="sidebar">
-            <h2>🤖 Visual Operator</h2>
-            <input type="text" class="command-input" placeholder="Tell me what to do..." id="commandInput">
-            
-            <div class="status-panel">
-                <h3>📊 System Status</h3>
-                <div class="status-item">
-                    <span>🖥️ Desktop Session:</span>
-                    <span style="color: #4ade80;">Active</span>
-                </div>
-                <div class="status-item">
-                    <span>🧠 AI Models:</span>
-                    <span style="color: #4ade80;">Ready</span>
-                </div>
-                <div class="status-item">
-                    <span>👁️ Vision System:</span>
-                    <span style="color: #4ade80;">Watching</span>
-                </div>
-                <div class="status-item">
-                    <span>🔒 Security:</span>
-                    <span style="color: #fbbf24;">Sandbox</span>
-                </div>
-            </div>
-            
-            <div class="status-panel">
-                <h3>⚡ Recent Actions</h3>
-                <div style="font-size: 12px; opacity: 0.8;">
-                    <div>• Opened Chrome browser</div>
-                    <div>• Navigated to website</div>
-                    <div>• Filled form fields</div>
-                    <div>• Clicked submit button</div>
-                </div>
-            </div>
-            
-            <div class="status-panel">
-                <h3>🎯 Capabilities</h3>
-                <div style="font-size: 12px; opacity: 0.8;">
-                    <div>✅ Web automation</div>
-                    <div>✅ Form filling</div>
-                    <div>✅ File management</div>
-                    <div>✅ Application control</div>
-                    <div>✅ Captcha solving</div>
-                    <div>✅ Multi-tasking</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="desktop-area">
-            <div class="desktop-header">
-                <h3>🖥️ Virtual Desktop Environment</h3>
-                <div>
-                    <span style="margin-right: 20px;">Resolution: 1920x1080</span>
-                    <span>FPS: 60</span>
-                </div>
-            </div>
-            
-            <div class="desktop-content">
-                <!-- Browser Window -->
-                <div class="virtual-window browser-window">
-                    <div class="window-header">
-                        <span>🌐 Chrome Browser</span>
-                        <span>🔴 🟡 🟢</span>
-                    </div>
-                    <div class="window-content">
-                        <div style="display: flex; align-items: center; margin-bottom: 15px;">
-                            <div style="background: #f0f0f0; border-radius: 20px; padding: 8px 15px; flex: 1; margin-right: 10px;">
-                                https://example.com
-                            </div>
-                            <button style="background: #4285f4; color: white; border: none; padding: 8px 15px; border-radius: 4px;">Go</button>
-                        </div>
-                        <div style="border: 1px solid #ddd; height: 250px; border-radius: 4px; background: white; padding: 20px;">
-                            <h2>Example Website</h2>
-                            <p>The AI operator is interacting with this webpage...</p>
-                            <form>
-                                <input type="text" placeholder="Username" style="width: 200px; padding: 8px; margin: 5px 0;">
-                                <br>
-                                <input type="password" placeholder="Password" style="width: 200px; padding: 8px; margin: 5px 0;">
-                                <br>
-                                <button type="button" style="background: #4ade80; color: white; border: none; padding: 10px 20px; margin: 10px 0; border-radius: 4px;">Login</button>
-                            </form>
-                        </div>
-                    </div>
-                </div>
-                
-                <!-- Terminal Window -->
-                <div class="virtual-window terminal-window">
-                    <div class="window-header">
-                        <span>💻 Terminal</span>
-                        <span>🔴 🟡 🟢</span>
-                    </div>
-                    <div class="terminal-content">
-                        <div>operator@virtual-desktop:~$ ls</div>
-                        <div>Desktop  Documents  Downloads  Pictures</div>
-                        <div>operator@virtual-desktop:~$ python script.py</div>
-                        <div>Running automation script...</div>
-                        <div>✅ Task completed successfully</div>
-                        <div>operator@virtual-desktop:~$ <span class="pulse">_</span></div>
-                    </div>
-                </div>
-                
-                <!-- Taskbar -->
-                <div class="taskbar">
-                    <div class="taskbar-item">📁 Files</div>
-                    <div class="taskbar-item">🌐 Chrome</div>
-                    <div class="taskbar-item">💻 Terminal</div>
-                    <div class="taskbar-item">⚙️ Settings</div>
-                    <div style="flex: 1;"></div>
-                    <div class="taskbar-item">14:32</div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // Simulate typing in command input
-        const commandInput = document.getElementById('commandInput');
-        const commands = [
-            "Open Chrome and go to example.com",
-            "Fill out the login form",
-            "Take a screenshot",
-            "Download the file from this page",
-            "Send an email with the results"
-        ];
-        
-        let commandIndex = 0;
-        
-        commandInput.addEventListener('keypress', function(e) {
-            if (e.key === 'Enter') {
-                const command = this.value;
-                if (command.trim()) {
-                    alert(`🤖 Operator: I'll ${command.toLowerCase()}\\n\\n🔄 Executing command...\\n⏳ Please wait while I complete this task.`);
-                    this.value = '';
-                }
-            }
-        });
-        
-        // Simulate command suggestions
-        setInterval(() => {
-            if (!commandInput.value && document.activeElement !== commandInput) {
-                commandInput.placeholder = `Try: "${commands[commandIndex]}"`;
-                commandIndex = (commandIndex + 1) % commands.length;
-            }
-        }, 3000);
-        
-        // Simulate window interactions
-        let windows = document.querySelectorAll('.virtual-window');
-        windows.forEach(window => {
-            let isDragging = false;
-            let currentX, currentY, initialX, initialY;
-            
-            window.querySelector('.window-header').addEventListener('mousedown', function(e) {
-                isDragging = true;
-                initialX = e.clientX - window.offsetLeft;
-                initialY = e.clientY - window.offsetTop;
-            });
-            
-            document.addEventListener('mousemove', function(e) {
-                if (isDragging) {
-                    e.preventDefault();
-                    currentX = e.clientX - initialX;
-                    currentY = e.clientY - initialY;
-                    window.style.left = currentX + 'px';
-                    window.style.top = currentY + 'px';
-                }
-            });
-            
-            document.addEventListener('mouseup', function() {
-                isDragging = false;
-            });
-        });
-        
-        console.log('🤖 Visual Desktop Operator Demo');
-        console.log('This is a demonstration of the operator interface.');
-        console.log('In production, this would show a real virtual desktop environment.');
-    </script>
-</body>
-</html>'''
-    
-    # Save demo file
+    # Save demo file, unless it already holds this exact page
     demo_file = Path(__file__).parent / "visual_operator_demo.html"
-    with open(demo_file, 'w', encoding='utf-8') as f:
-        f.write(demo_html)
+    demo_html = _demo_html()
+    if demo_file.exists() and demo_file.read_bytes() == demo_html:
+        return demo_file
+
+    tmp_file = demo_file.with_suffix(".html.tmp")
+    tmp_file.write_bytes(demo_html)
+    os.replace(tmp_file, demo_file)
     
     return demo_file
 
-def main():
-    """Main startup function"""
-    print("🎯 Visual Desktop Operator - Development Mode")
-    print("=" * 60)
-    
-    current_dir = Path(__file__).parent
-    print(f"📁 Working directory: {current_dir}")
-    
-    # Create .env file if it doesn't exist
-    env_file = current_dir / ".env"
-    if not env_file.exists():
-        print("📝 Creating development .env file...")
-        env_content = """# Development configuration
+@cache
+def _demo_url(demo_file):
+    """file:// URL of the demo page"""
+    return f"file:///{demo_file.as_posix()}"
+
+def wait_for_ctrl_c():
+    """Block until Ctrl+C (KeyboardInterrupt) without waking up every second"""
+    while True:
+        if hasattr(signal, "pause"):
+            signal.pause()
+        else:
+            # No signal.pause on Windows, but Ctrl+C interrupts time.sleep there
+            time.sleep(3600)
+
+# Development configuration written to .env when there isn't one
+_ENV_TEMPLATE = """# Development configuration
 DEBUG=true
 ENVIRONMENT=development
 SECRET_KEY=development-secret-key
@@ -448,18 +168,37 @@ MAX_CONCURRENT_SESSIONS=2
 ENABLE_LOGGING=true
 LOG_LEVEL=INFO
 """
-        with open(env_file, 'w') as f:
-            f.write(env_content)
+
+def main():
+    """Main startup function"""
+    print("🎯 Visual Desktop Operator - Development Mode")
+    print("=" * 60)
+    
+    current_dir = Path(__file__).parent
+    print(f"📁 Working directory: {current_dir}")
+    
+    # Create .env file if it doesn't exist
+    env_file = current_dir / ".env"
+    if not env_file.exists():
+        print("📝 Creating development .env file...")
+        tmp_file = env_file.with_name(".env.tmp")
+        tmp_file.write_bytes(_ENV_TEMPLATE.encode("utf-8"))
+        os.replace(tmp_file, env_file)  # never leaves a half-written .env behind
         print("✅ Created .env file")
     
+    # Start the backend and frontend servers side by side
+    start_backend()
+    start_frontend()
+
     # Create demo session
     demo_file = create_demo_session()
     print(f"✅ Created demo interface: {demo_file}")
     
     # Open demo in browser
     print("\n🌐 Opening Visual Desktop Operator Demo...")
-    demo_url = f"file:///{demo_file.as_posix()}"
-    webbrowser.open(demo_url)
+    demo_url = _demo_url(demo_file)
+    # webbrowser.open can block for a while on Windows - don't hold up the banner
+    threading.Thread(target=webbrowser.open, args=(demo_url,), daemon=True).start()
     
     print("\n" + "=" * 60)
     print("🎉 VISUAL DESKTOP OPERATOR DEMO RUNNING")
@@ -481,10 +220,11 @@ LOG_LEVEL=INFO
     print("Press Ctrl+C to exit...")
     
     try:
-        while True:
-            time.sleep(1)
+        wait_for_ctrl_c()
     except KeyboardInterrupt:
         print("\n👋 Shutting down Visual Desktop Operator Demo")
+    finally:
+        stop_servers()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -160,7 +160,10 @@ def test_screenshot_optimization():
         ai_engine = AIDecisionEngine(provider="claude", api_key=api_key)
         optimized_b64 = ai_engine._optimize_screenshot(original_bytes)
 
-        import base64
+        try:
+            import pybase64 as base64  # SIMD base64, same API as the stdlib module
+        except ImportError:
+            import base64
         optimized_bytes = base64.b64decode(optimized_b64)
         print(f"Optimized screenshot: {len(optimized_bytes) / 1024:.1f} KB")
 
@@ -257,8 +260,8 @@ def test_live_ai_decision():
         if success:
             print("✅ Action executed successfully")
             time.sleep(2)
-            operator.page.screenshot(path="ai_decision_result.png")
-            print("📸 Result screenshot: ai_decision_result.png")
+            operator.page.screenshot(path="ai_decision_result.jpg", type="jpeg", quality=80)
+            print("📸 Result screenshot: ai_decision_result.jpg")
         else:
             print("❌ Action failed")
 
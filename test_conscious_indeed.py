@@ -79,9 +79,9 @@ def test_indeed_job_search():
         for i, action in enumerate(operator.memory.actions_taken, 1):
             print(f"  {i}. {action.type:12} → {action.reasoning}")
 
-        # Take screenshot of results
-        screenshot_path = "indeed_results.png"
-        operator.page.screenshot(path=screenshot_path)
+        # Take screenshot of results (JPEG - it's only for review)
+        screenshot_path = "indeed_results.jpg"
+        operator.page.screenshot(path=screenshot_path, type="jpeg", quality=80)
         print(f"\n📸 Screenshot saved: {screenshot_path}")
 
         # Analyze what we see now
@@ -135,8 +135,8 @@ def test_indeed_job_search():
             print(f"URL: {final_vision.current_url}")
 
             # Save final screenshot
-            operator.page.screenshot(path="indeed_job_detail.png")
-            print("\n📸 Screenshot saved: indeed_job_detail.png")
+            operator.page.screenshot(path="indeed_job_detail.jpg", type="jpeg", quality=80)
+            print("\n📸 Screenshot saved: indeed_job_detail.jpg")
 
         else:
             print(f"⚠️ GOAL 2 incomplete ({duration2:.1f}s)")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Regression tests: learned actions in the intelligent adaptive operator
+must not override what the page itself shows
+"""
+import asyncio
+import shelve
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from intelligent_adaptive_operator import IntelligentAdaptiveOperator, PageContext, Perception
+
+CV = {'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '(555) 123-4567'}
+DETAIL_URL = 'https://jobs.example.com/job/1'
+
+
+def _detail_page(buttons, url=DETAIL_URL):
+    return Perception(
+        url=url,
+        title='Developer',
+        visible_buttons=buttons,
+        visible_inputs=[],
+        visible_text='',
+        context=PageContext.JOB_DETAIL_PAGE,
+        timestamp=0.0
+    )
+
+
+def _operator(tmp_path):
+    operator = IntelligentAdaptiveOperator(goal='Apply', cv_data=CV, memory_path=str(tmp_path / 'memory'))
+    operator._memory = shelve.open(operator._memory_path)
+    return operator
+
+
+def test_learned_action_does_not_override_visible_apply_button(tmp_path):
+    operator = _operator(tmp_path)
+    try:
+        page = _detail_page(['Apply now'])
+        operator._memory[operator._memory_key(page)] = 'scroll_down'
+
+        thought = asyncio.run(operator.think(page))
+
+        assert thought.suggested_action == 'click_apply_button'
+    finally:
+        operator._memory.close()
+
+
+def test_learned_action_breaks_tie_when_heuristics_are_unsure(tmp_path):
+    operator = _operator(tmp_path)
+    try:
+        page = _detail_page(['Save job'])
+        operator._memory[operator._memory_key(page)] = 'click_first_job'
+
+        thought = asyncio.run(operator.think(page))
+
+        assert thought.suggested_action == 'click_first_job'
+    finally:
+        operator._memory.close()
+
+
+def test_action_that_leaves_page_unchanged_is_not_learned(tmp_path):
+    operator = _operator(tmp_path)
+    try:
+        page = _detail_page(['Save job'])
+        key = operator._memory_key(page)
+
+        # scroll_down "succeeds" but the next perception is the same page
+        operator._pending_lesson = (key, 'scroll_down', page.url, page.context)
+        operator._learn_from(_detail_page(['Save job']))
+        assert key not in operator._memory
+
+        # an action that leads to a new URL is remembered
+        operator._pending_lesson = (key, 'click_first_job', page.url, page.context)
+        operator._learn_from(_detail_page(['Apply'], url=DETAIL_URL + '/apply'))
+        assert operator._memory[key] == 'click_first_job'
+    finally:
+        operator._memory.close()
+
+
+def test_memory_is_not_opened_until_the_run(tmp_path):
+    operator = IntelligentAdaptiveOperator(goal='Apply', cv_data=CV, memory_path=str(tmp_path / 'memory'))
+
+    assert operator._memory is None
+    assert not list(tmp_path.iterdir())